@@ -31,6 +31,7 @@ class UserListAutoComplete(ModelAutocomplete):
 
     model = Account
     search_attrs = ["first_name", "last_name", "username"]
+    label_select_fields = ("first_name", "last_name", "username")
 
     @classmethod
     def get_query_filtered_queryset(cls, search, context):
@@ -82,3 +83,4 @@ class AllUsersComplete(ModelAutocomplete):
 
     model = Account
     search_attrs = ["first_name", "last_name", "username"]
+    label_select_fields = ("first_name", "last_name", "username")
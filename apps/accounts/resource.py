@@ -5,6 +5,7 @@ import re
 
 # Django imports
 from django.contrib.auth.models import Group
+from django.utils.functional import cached_property
 
 # external imports
 from import_export import fields, resources, widgets
@@ -79,8 +80,12 @@ class AccountWidget(widgets.ForeignKeyWidget):
                 Value supplied for ``kwargs``.
 
         Returns:
-            (object):
-                The result of the operation.
+            (Account or None):
+                The matched account, or None if value is empty.
+
+        Raises:
+            Account.DoesNotExist:
+                If a non-empty value cannot be matched to any account.
 
         Examples:
             Inspect the public interface in an interactive session::
@@ -97,8 +102,8 @@ class AccountWidget(widgets.ForeignKeyWidget):
         if account:
             return account
 
-        # Build initials and formal names lookup
-        initials, formal_names = self._build_initials_and_formal_names()
+        # Look up the cached tables of staff initials and formal names
+        initials, formal_names = self._staff_lookup
 
         # Try matching by initials or formal names
         account = self._match_by_initials_or_formal_names(value, initials, formal_names)
@@ -111,16 +116,65 @@ class AccountWidget(widgets.ForeignKeyWidget):
             return account
 
         # Try matching by first and last name
-        return self._match_by_first_last_name(value)
+        account = self._match_by_first_last_name(value)
+        if account:
+            return account
+
+        raise Account.DoesNotExist(f"No account matches {value!r}")
+
+    def prime(self, values):
+        """Look up the accounts for a batch of SIDs or usernames at once, ready for clean().
+
+        Args:
+            values (iterable):
+                The values that clean() is about to be called with, e.g. a column of an import dataset.
+
+        Notes:
+            Only the number and username matches are primed - values that need the name based matches still fall
+            through to them in clean().
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(AccountWidget.prime)
+                True
+
+        """
+        numbers, usernames = {}, {}
+        for value in values:
+            if not value:
+                continue
+            try:
+                numbers[value] = int(value)
+            except (TypeError, ValueError):
+                usernames[value] = value
+        by_number = {}
+        for account in Account.objects.filter(number__in=set(numbers.values())):
+            # Keep the first in the default ordering, as first() would, should a number be duplicated
+            by_number.setdefault(account.number, account)
+        by_username = {account.username: account for account in Account.objects.filter(username__in=usernames)}
+        self._primed = {value: by_number.get(number) for value, number in numbers.items()}
+        self._primed.update({value: by_username.get(value) for value in usernames})
 
     def _match_by_number_or_username(self, value):
         """See if value can be interpreted as a SID or usnername."""
+        if value in getattr(self, "_primed", {}):
+            return self._primed[value]
         try:
             value = int(value)
             qs = Account.objects.filter(number=value)
         except (TypeError, ValueError):
             qs = Account.objects.filter(username=value)
-        return qs.first() if qs.exists() else None
+        return qs.first()
+
+    @cached_property
+    def _staff_lookup(self):
+        """Cache the staff initials and formal names tables for the lifetime of the widget.
+
+        import-export copies the resource fields, and so their widgets, for each import, so the
+        staff query runs once per import rather than once per row.
+        """
+        return self._build_initials_and_formal_names()
 
     def _build_initials_and_formal_names(self):
         """Builtables of staff initials and formal names."""
@@ -140,16 +194,15 @@ class AccountWidget(widgets.ForeignKeyWidget):
         pattern = self.given_name_pattern if "(" in value else self.display_name_pattern
         match = pattern.match(value)
         if match:
-            qs = Account.objects.filter(**match.groupdict())
-            return qs.first() if qs.exists() else None
+            return Account.objects.filter(**match.groupdict()).first()
         return None
 
     def _match_by_first_last_name(self, value):
         """Match by first and las names."""
         if " " in value:
-            first_name, last_name = value.split(" ")[0], value.split(" ")[-1]
-            qs = Account.objects.filter(first_name=first_name, last_name=last_name)
-            return qs.first() if qs.exists() else None
+            parts = value.split(" ")
+            first_name, last_name = parts[0], parts[-1]
+            return Account.objects.filter(first_name=first_name, last_name=last_name).first()
         return None
 
 
@@ -222,7 +275,7 @@ class AccountsWidget(widgets.ManyToManyWidget):
     def _match_names_to_pks(self, ids):
         """Match names to primary keys."""
         pks = []
-        initials, formal_names = self._build_name_lookup()
+        initials, formal_names = self._name_lookup
 
         for value in ids:
             if "," in value:  # last_name, first_name
@@ -235,6 +288,11 @@ class AccountsWidget(widgets.ManyToManyWidget):
                 pks.extend(self._match_first_last_name(value))
         return pks
 
+    @cached_property
+    def _name_lookup(self):
+        """Cache the staff initials and formal names tables for the lifetime of the widget."""
+        return self._build_name_lookup()
+
     def _build_name_lookup(self):
         """Build lookup dictionaries for initials and formal names."""
         initials = {}
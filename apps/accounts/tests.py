@@ -240,6 +240,16 @@ class TestAccountViews:
         response = client_logged_in.get(url)
         assert response.context["account"] == regular_user
 
+    @pytest.mark.django_db
+    def test_account_views_read_bookings_once(self, client_logged_in, regular_user):
+        """Verify that the account pages hand the template a list of bookings rather than a queryset to re-run."""
+        for url in (
+            reverse("accounts:my_account"),
+            reverse("accounts:user_account", kwargs={"username": regular_user.username}),
+        ):
+            response = client_logged_in.get(url)
+            assert response.context["bookings"] == []
+
     @pytest.mark.django_db
     def test_account_list_by_group_view_requires_login(self, client):
         """Unauthenticated requests to AccountListByGroupView redirect to login."""
@@ -275,3 +285,38 @@ class TestAccountViews:
         url = reverse("accounts:user_account", kwargs={"username": regular_user.username})
         response = client_logged_in.get(url, HTTP_HX_REQUEST="true", HTTP_HX_TRIGGER_NAME="projecttab")
         assert response.status_code == 200
+
+
+class TestAccountWidget:
+    """Tests for the import-export AccountWidget."""
+
+    @pytest.mark.django_db
+    def test_clean_matches_username(self, regular_user):
+        """Verify that clean resolves an account from its username."""
+        # external imports
+        from accounts.models import Account
+        from accounts.resource import AccountWidget
+
+        assert AccountWidget(Account, "username").clean("testuser") == regular_user
+
+    @pytest.mark.django_db
+    def test_clean_raises_for_unmatched_value(self, regular_user):
+        """Verify that clean raises DoesNotExist rather than silently returning None."""
+        # external imports
+        from accounts.models import Account
+        from accounts.resource import AccountWidget
+
+        with pytest.raises(Account.DoesNotExist):
+            AccountWidget(Account, "username").clean("nobody-by-this-name")
+
+    @pytest.mark.django_db
+    def test_prime_avoids_per_value_queries(self, regular_user, django_assert_num_queries):
+        """Verify that a primed widget resolves usernames without querying again."""
+        # external imports
+        from accounts.models import Account
+        from accounts.resource import AccountWidget
+
+        widget = AccountWidget(Account, "username")
+        widget.prime(["testuser", "testuser", ""])
+        with django_assert_num_queries(0):
+            assert widget.clean("testuser") == regular_user
@@ -92,7 +92,7 @@ class UserAccountView(IsAuthenticaedViewMixin, HTMXProcessMixin, views.generic.D
         context = super().get_context_data(**kwargs)
         me = context["account"]
         future = DateTimeTZRange(tz.now(), None)
-        context["bookings"] = me.bookings.filter(slot__overlap=future)
+        context["bookings"] = list(me.bookings.filter(slot__overlap=future).select_related("equipment", "cost_centre"))
         return context
 
 
@@ -168,7 +168,7 @@ class MyAccountView(UserAccountView):
         context = super().get_context_data(**kwargs)
         me = context["account"]
         future = DateTimeTZRange(tz.now(), None)
-        context["bookings"] = me.bookings.filter(slot__overlap=future)
+        context["bookings"] = list(me.bookings.filter(slot__overlap=future).select_related("equipment", "cost_centre"))
         return context
 
 
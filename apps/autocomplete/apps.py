@@ -1,6 +1,7 @@
 """Configure the autocomplete application and discover registered implementations."""
 
 # Python imports
+import logging
 from importlib import import_module
 
 # Django imports
@@ -9,6 +10,8 @@ from django.apps import AppConfig, apps
 # app imports
 from . import Autocomplete, ModelAutocomplete, register
 
+logger = logging.getLogger(__name__)
+
 
 class AutocompleteConfig(AppConfig):
     """Configure autocomplete discovery and registration.
@@ -50,4 +53,4 @@ class AutocompleteConfig(AppConfig):
                         register(obj)
                     except ValueError:
                         continue
-                    print(f"Registered Autocomplete {appname}:{name}")
+                    logger.debug("Registered Autocomplete %s:%s", appname, name)
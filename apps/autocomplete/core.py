@@ -6,7 +6,9 @@ and provides the foundation for creating custom autocomplete implementations.
 """
 
 # Python imports
+import json
 from dataclasses import dataclass
+from functools import partial
 
 # Django imports
 from django.conf import settings
@@ -19,16 +21,24 @@ from django.utils.translation import gettext_lazy as _
 _ac_registry = {}
 
 
-AC_CLASS_CONFIGURABLE_VALUES = {
-    "disabled",
-    "no_result_text",
-    "narrow_search_text",
-    "minimum_search_length",
-    "max_results",
-    "component_prefix",
-    "placeholder",
-    "indicator",
-}
+AC_CLASS_CONFIGURABLE_VALUES = frozenset(
+    {
+        "disabled",
+        "no_result_text",
+        "narrow_search_text",
+        "minimum_search_length",
+        "max_results",
+        "component_prefix",
+        "placeholder",
+        "indicator",
+    }
+)
+
+AC_CLASS_REQUIRED_METHODS = ("search_items", "get_items_from_keys")
+
+
+# The payloads are sent in HTTP headers, so non-ASCII characters must be escaped rather than written as raw UTF-8.
+_dump_json = partial(json.dumps, separators=(",", ":"), default=str, ensure_ascii=True)
 
 
 def register(ac_class: type, route_name: str = None):
@@ -96,6 +106,10 @@ class Autocomplete:
             Maximum number of results to return in a single search.
         component_prefix (str):
             Prefix added to component IDs for namespacing.
+        search_cache_timeout (int):
+            Number of seconds to cache rendered search results for. Caching is disabled
+            by default; only enable it for autocompletes whose results do not depend on
+            the requesting user.
         route_name (str):
             The unique name used in URLs, set during registration.
 
@@ -122,6 +136,19 @@ class Autocomplete:
     minimum_search_length = 3
     max_results = 100
     component_prefix = ""
+    search_cache_timeout = 0
+    _missing_methods = AC_CLASS_REQUIRED_METHODS
+
+    def __init_subclass__(cls, **kwargs):
+        """Record which required methods the new subclass is missing.
+
+        The class dictionaries along the MRO are probed once at class-definition time so that
+        validate() does not need to repeat attribute lookups on every registration.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._missing_methods = tuple(
+            name for name in AC_CLASS_REQUIRED_METHODS if not any(name in klass.__dict__ for klass in cls.__mro__)
+        )
 
     @classmethod
     def auth_check(cls, request):
@@ -155,6 +182,8 @@ class Autocomplete:
     def validate(cls):
         """Validate that the autocomplete class implements required methods.
 
+        The check uses the list of missing methods computed when the class was defined.
+
         Raises:
             ValueError:
                 If the class does not implement search_items or get_items_from_keys
@@ -168,11 +197,8 @@ class Autocomplete:
                 True
 
         """
-        if not hasattr(cls, "search_items"):
-            raise ValueError("You must implement a search_items method.")
-
-        if not hasattr(cls, "get_items_from_keys"):
-            raise ValueError("You must implement a get_items_from_keys method.")
+        if cls._missing_methods:
+            raise ValueError(f"You must implement a {cls._missing_methods[0]} method.")
 
     @classmethod
     def map_search_results(cls, items_iterable, selected_keys=None):
@@ -216,6 +242,29 @@ class Autocomplete:
             for i in items_iterable
         ]
 
+    @classmethod
+    def dump_json(cls, data):
+        """Serialise mapped results or event payloads to a compact JSON string.
+
+        Args:
+            data (object):
+                The JSON-compatible data to serialise. Values that are not natively
+                serialisable (such as lazy translation strings) are converted with str().
+
+        Returns:
+            (str): The JSON encoded data.
+
+        Notes:
+            Non-ASCII characters are escaped, so that the result can be used as an HTTP header value
+            (such as HX-Trigger-After-Settle).
+
+        Examples:
+            >>> Autocomplete.dump_json([{"key": "1", "label": "Item 1", "selected": True}])
+            '[{"key":"1","label":"Item 1","selected":true}]'
+
+        """
+        return _dump_json(data)
+
     @classmethod
     def get_custom_strings(cls):
         """Get localised UI strings for the autocomplete component.
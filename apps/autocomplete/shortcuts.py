@@ -10,6 +10,7 @@ import operator
 from functools import reduce
 
 # Django imports
+from django.core.exceptions import ValidationError
 from django.db.models import Q
 
 # app imports
@@ -29,6 +30,10 @@ class ModelAutocomplete(Autocomplete):
         search_attrs (list):
             List of model field names to search across. Supports related field
             lookups using Django's double-underscore notation.
+        label_select_fields (tuple):
+            Model field names needed by get_label_for_record. When set, querysets
+            used to build results are restricted with ``.only()`` to these fields
+            (the primary key is always loaded). Leave empty to fetch full rows.
 
     Examples:
         >>> class UserAutocomplete(ModelAutocomplete):
@@ -43,6 +48,7 @@ class ModelAutocomplete(Autocomplete):
 
     model = None
     search_attrs = []
+    label_select_fields = ()
 
     @classmethod
     def get_search_attrs(cls):
@@ -86,7 +92,7 @@ class ModelAutocomplete(Autocomplete):
                 True
 
         """
-        if not cls.model:
+        if cls.model is None:
             raise ValueError("ModelAutocomplete must have a model")
 
         return cls.model
@@ -111,6 +117,29 @@ class ModelAutocomplete(Autocomplete):
         """
         return cls.get_model().objects.all()
 
+    @classmethod
+    def get_label_queryset(cls, queryset):
+        """Restrict a QuerySet to the columns needed to build result labels.
+
+        Args:
+            queryset (QuerySet):
+                The QuerySet to restrict.
+
+        Returns:
+            (QuerySet): The QuerySet limited with ``.only()`` to label_select_fields, or
+                the original QuerySet if label_select_fields is empty.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(ModelAutocomplete.get_label_queryset)
+                True
+
+        """
+        if not cls.label_select_fields:
+            return queryset
+        return queryset.only(*cls.label_select_fields)
+
     @classmethod
     def get_label_for_record(cls, record):
         """Generate a display label for a model instance.
@@ -187,7 +216,7 @@ class ModelAutocomplete(Autocomplete):
                 True
 
         """
-        filtered_queryset = cls.get_query_filtered_queryset(search, context)
+        filtered_queryset = cls.get_label_queryset(cls.get_query_filtered_queryset(search, context))
 
         items = QuerysetMappedIterable(queryset=filtered_queryset, label_for_record=cls.get_label_for_record)
         return items
@@ -204,7 +233,12 @@ class ModelAutocomplete(Autocomplete):
 
         Returns:
             (list): List of dictionaries with 'key' and 'label' fields for each
-                found model instance.
+                found model instance, in the order the keys were given.
+
+        Notes:
+            Keys are converted with the model's primary key field so that string keys from
+            request data match the dictionary returned by ``in_bulk()``. Keys that cannot be
+            converted, or that do not match a record, are skipped.
 
 
         Examples:
@@ -214,10 +248,21 @@ class ModelAutocomplete(Autocomplete):
                 True
 
         """
-        queryset = cls.get_queryset()
-        results = queryset.filter(id__in=keys)
-
-        return [{"key": record.id, "label": cls.get_label_for_record(record)} for record in results]
+        pk_field = cls.get_model()._meta.pk
+        pks = []
+        for key in keys:
+            try:
+                pks.append(pk_field.to_python(key))
+            except ValidationError:
+                continue
+        pks = list(dict.fromkeys(pks))  # Remove duplicates whilst preserving order
+        records = cls.get_label_queryset(cls.get_queryset()).in_bulk(pks)
+
+        return [
+            {"key": record.id, "label": cls.get_label_for_record(record)}
+            for record in (records.get(pk) for pk in pks)
+            if record is not None
+        ]
 
 
 class QuerysetMappedIterable:
@@ -407,12 +407,18 @@ class TestAutocompleteBaseView:
         with pytest.raises(Http404):
             _ = view.ac_class
 
-    def test_request_dict_returns_get_params(self):
-        """request_dict converts the QueryDict to a plain dict."""
+    def test_get_configurable_value_is_memoised(self):
+        """get_configurable_value stores resolved values in the per-request cache."""
         view = self._make_view("BaseViewTestAC")
-        d = view.request_dict
-        assert d["field_name"] == "my_field"
-        assert d["component_prefix"] == "pfx_"
+        assert view.get_configurable_value("component_prefix") == "pfx_"
+        assert view._config_cache["component_prefix"] == "pfx_"
+        view._config_cache["component_prefix"] = "cached_"
+        assert view.get_configurable_value("component_prefix") == "cached_"
+
+    def test_get_configurable_value_prefers_last_request_value(self):
+        """get_configurable_value reads the request QueryDict directly, returning the last value."""
+        view = self._make_view("BaseViewTestAC", {"placeholder": ["first", "last"]})
+        assert view.get_configurable_value("placeholder") == "last"
 
     def test_get_field_name_returns_field_name(self):
         """get_field_name extracts the field_name parameter from the request."""
@@ -531,6 +537,53 @@ class TestItemsView:
         response = view.get(request)
         assert response.status_code == 200
 
+    def test_items_view_short_query_does_not_search(self):
+        """ItemsView.get does not call search_items when the query is too short."""
+        # external imports
+        from autocomplete.views import ItemsView
+
+        ac = _register_test_ac("ItemsViewTestAC")
+        request = self._make_request("ItemsViewTestAC", search="a")
+        view = ItemsView()
+        view.request = request
+        view.kwargs = {"ac_name": "ItemsViewTestAC"}
+        view.args = ()
+        original = ac.search_items
+        ac.search_items = search_items = MagicMock(return_value=[])
+        try:
+            response = view.get(request)
+        finally:
+            ac.search_items = original
+        assert response.status_code == 200
+        search_items.assert_not_called()
+
+    def test_items_view_serves_cached_results_when_enabled(self):
+        """ItemsView.get reuses the cached fragment for a repeated query when caching is enabled."""
+        # Django imports
+        from django.core.cache import cache
+
+        # external imports
+        from autocomplete.core import _ac_registry
+        from autocomplete.views import ItemsView
+
+        ac = _register_test_ac("ItemsViewCachedAC")
+        ac.search_cache_timeout = 30
+        ac.search_items = MagicMock(return_value=[{"key": "1", "label": "Alpha"}])
+        try:
+            responses = []
+            for _ in range(2):
+                request = self._make_request("ItemsViewCachedAC", search="alpha")
+                view = ItemsView()
+                view.request = request
+                view.kwargs = {"ac_name": "ItemsViewCachedAC"}
+                view.args = ()
+                responses.append(view.get(request))
+            assert ac.search_items.call_count == 1
+            assert responses[0].content == responses[1].content
+        finally:
+            cache.clear()
+            del _ac_registry["ItemsViewCachedAC"]
+
 
 # ---------------------------------------------------------------------------
 # Tests for ToggleView
@@ -613,6 +666,30 @@ class TestToggleView:
         response = view.get(request)
         assert "HX-Trigger-After-Settle" in response.headers
 
+    def test_toggle_view_htmx_trigger_header_is_valid_json(self):
+        """The HX-Trigger-After-Settle header decodes to the change event payload."""
+        # external imports
+        from autocomplete.views import ToggleView
+
+        _register_test_ac("ToggleViewTestAC")
+        request = self._make_request("ToggleViewTestAC", item="1")
+        view = ToggleView()
+        view.request = request
+        view.kwargs = {"ac_name": "ToggleViewTestAC"}
+        view.args = ()
+        response = view.get(request)
+        payload = json.loads(response.headers["HX-Trigger-After-Settle"])
+        assert payload["my_field_change"]["item"] == {"key": "1", "label": "Alpha", "selected": True}
+
+    def test_dump_json_escapes_non_ascii_for_headers(self):
+        """dump_json escapes non-ASCII labels so that the payload is a valid HTTP header value."""
+        # external imports
+        from autocomplete.core import Autocomplete
+
+        dumped = Autocomplete.dump_json({"label": "Zoë Müller"})
+        assert dumped.isascii()
+        assert json.loads(dumped) == {"label": "Zoë Müller"}
+
 
 # ---------------------------------------------------------------------------
 # Tests for QuerysetMappedIterable
@@ -845,14 +922,14 @@ class TestAutocompleteWidget:
         result = widget.value_from_datadict(data, {}, "my_field")
         assert result == ["1", "2"]
 
-    def test_value_omitted_from_data_returns_empty_list(self):
-        """value_omitted_from_data always returns an empty list."""
+    def test_value_omitted_from_data_returns_false(self):
+        """value_omitted_from_data always returns False."""
         # external imports
         from autocomplete.widgets import AutocompleteWidget
 
         ac = self._make_ac_class()
         widget = AutocompleteWidget(ac)
-        assert widget.value_omitted_from_data({}, {}, "my_field") == []
+        assert widget.value_omitted_from_data({}, {}, "my_field") is False
 
     def test_get_configurable_value_from_config(self):
         """get_configurable_value returns value from widget config when present."""
@@ -1256,6 +1333,113 @@ class TestModelAutocompleteSuccessPaths:
 
         assert WithModel.get_model() is object
 
+    def test_later_assignments_are_honoured(self):
+        """get_model and get_search_attrs follow model and search_attrs assigned after the class is defined."""
+        # external imports
+        from autocomplete.shortcuts import ModelAutocomplete
+
+        class Reassigned(ModelAutocomplete):
+            """Provide the Reassigned implementation."""
+
+            model = object
+            search_attrs = ["name"]
+
+        Reassigned.model = dict
+        Reassigned.search_attrs = ["email"]
+        assert Reassigned.get_model() is dict
+        assert Reassigned.get_search_attrs() == ["email"]
+
+
+class TestModelAutocompleteLabelProjection:
+    """Tests for the ``label_select_fields`` projection of ``ModelAutocomplete``."""
+
+    def test_queryset_unchanged_without_label_select_fields(self):
+        """get_label_queryset returns the QuerySet untouched when no fields are configured."""
+        # external imports
+        from autocomplete.shortcuts import ModelAutocomplete
+
+        qs = MagicMock()
+        assert ModelAutocomplete.get_label_queryset(qs) is qs
+        qs.only.assert_not_called()
+
+    def test_queryset_restricted_to_label_select_fields(self):
+        """get_label_queryset applies ``only()`` with the configured label fields."""
+        # external imports
+        from autocomplete.shortcuts import ModelAutocomplete
+
+        class WithProjection(ModelAutocomplete):
+            """Provide the WithProjection implementation."""
+
+            model = object
+            search_attrs = ["name"]
+            label_select_fields = ("name",)
+
+        qs = MagicMock()
+        assert WithProjection.get_label_queryset(qs) is qs.only.return_value
+        qs.only.assert_called_once_with("name")
+
+
+class TestModelAutocompleteGetItemsFromKeys:
+    """Tests for ``ModelAutocomplete.get_items_from_keys``."""
+
+    def _make_ac(self, records):
+        """Build a ModelAutocomplete subclass whose QuerySet returns ``records`` from ``in_bulk``.
+
+        Args:
+            records (dict): Mapping of primary key to mock record.
+
+        Returns:
+            (type): The autocomplete class.
+
+        """
+        # Django imports
+        from django.core.exceptions import ValidationError
+
+        # external imports
+        from autocomplete.shortcuts import ModelAutocomplete
+
+        def to_python(value):
+            """Convert the key to an integer primary key."""
+            try:
+                return int(value)
+            except ValueError as err:
+                raise ValidationError("invalid") from err
+
+        model = MagicMock()
+        model._meta.pk.to_python = MagicMock(side_effect=to_python)
+        model.objects.all.return_value.in_bulk = MagicMock(
+            side_effect=lambda pks: {pk: records[pk] for pk in pks if pk in records}
+        )
+
+        class BulkAC(ModelAutocomplete):
+            """Provide the BulkAC implementation."""
+
+            search_attrs = ["name"]
+
+        BulkAC.model = model
+        return BulkAC
+
+    def _make_record(self, pk, label):
+        """Create a mock record with an id and str representation."""
+        r = MagicMock()
+        r.id = pk
+        r.__str__ = MagicMock(return_value=label)
+        return r
+
+    def test_results_follow_key_order(self):
+        """Results are returned in the order the keys were supplied."""
+        records = {1: self._make_record(1, "Alpha"), 2: self._make_record(2, "Beta")}
+        ac = self._make_ac(records)
+        result = ac.get_items_from_keys(["2", "1"], None)
+        assert result == [{"key": 2, "label": "Beta"}, {"key": 1, "label": "Alpha"}]
+
+    def test_invalid_and_missing_keys_are_skipped(self):
+        """Keys that cannot be converted or do not exist are ignored."""
+        records = {1: self._make_record(1, "Alpha")}
+        ac = self._make_ac(records)
+        result = ac.get_items_from_keys(["bogus", "3", "1", "1"], None)
+        assert result == [{"key": 1, "label": "Alpha"}]
+
 
 class TestToggleSetRemainingBranches:
     """Tests for the remaining branches of ``toggle_set``."""
@@ -1271,6 +1455,14 @@ class TestToggleSetRemainingBranches:
         assert "1" in result
         assert "3" in result
 
+    def test_mixed_type_members_are_normalised_to_strings(self):
+        """toggle_set returns string keys even when the input set holds other types."""
+        # external imports
+        from autocomplete.views import toggle_set
+
+        result = toggle_set({1, "2"}, 3)
+        assert result == {"1", "2", "3"}
+
 
 class TestToggleViewAdvanced:
     """Advanced tests for ``ToggleView.get`` covering additional branches."""
@@ -1405,6 +1597,19 @@ class TestWidgetGetContextWithValue:
         ac.get_items_from_keys.assert_called_once_with(["1", "2"], None)
         assert len(ctx["values"]) == 2
 
+    def test_get_context_with_empty_value_skips_lookup(self):
+        """get_context does not call get_items_from_keys when no keys are selected."""
+        # external imports
+        from autocomplete.widgets import AutocompleteWidget
+
+        ac = MagicMock()
+        ac.route_name = "TestWidgetAC4"
+        ac.component_prefix = ""
+        widget = AutocompleteWidget(ac, options={"multiselect": True})
+        ctx = widget.get_context("my_field", ["", None], {"id": "id_my_field"})
+        ac.get_items_from_keys.assert_not_called()
+        assert ctx["values"] == []
+
 
 class TestToggleViewEdgeCases:
     """Edge case tests for ``ToggleView.get``."""
@@ -1549,3 +1754,20 @@ class TestAutocompleteValidate:
 
         with pytest.raises(ValueError, match="get_items_from_keys"):
             NoGetItems.validate()
+
+    def test_missing_methods_computed_at_class_definition(self):
+        """Verify that subclasses record their missing required methods when defined."""
+        # external imports
+        from autocomplete.core import Autocomplete
+        from autocomplete.shortcuts import ModelAutocomplete
+
+        class Partial(Autocomplete):
+            """Provide the Partial implementation."""
+
+            @classmethod
+            def search_items(cls, s, ctx):
+                """Perform the search items operation."""
+                return []
+
+        assert Partial._missing_methods == ("get_items_from_keys",)
+        assert ModelAutocomplete._missing_methods == ()
@@ -6,17 +6,22 @@ Views integrate with HTMX for dynamic updates without full page reloads.
 """
 
 # Python imports
-import json
+import hashlib
 
 # Django imports
-from django.http import Http404, HttpResponseBadRequest
-from django.shortcuts import render
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, HttpResponseBadRequest
+from django.template.loader import render_to_string
+from django.utils.translation import get_language
 from django.utils.functional import cached_property
 from django.views import View
 
 # app imports
 from .core import AC_CLASS_CONFIGURABLE_VALUES, ContextArg, _ac_registry
 
+# Values the client sends for a field with nothing selected
+EMPTY_SELECTION_VALUES = frozenset({"undefined", ""})
+
 
 class AutocompleteBaseView(View):
     """Base view providing common functionality for autocomplete views.
@@ -100,22 +105,9 @@ class AutocompleteBaseView(View):
         return super().dispatch(request, *args, **kwargs)
 
     @cached_property
-    def request_dict(self):
-        """Convert request QueryDict to a regular dictionary.
-
-        Returns:
-            (dict): Dictionary containing the request GET parameters.
-
-
-        Examples:
-            Inspect the public interface in an interactive session::
-
-                >>> callable(AutocompleteBaseView.request_dict)
-                True
-
-        """
-        # convert the request's QueryDict into a regular dict
-        return self.request.GET.dict()
+    def _config_cache(self):
+        """Store configuration values resolved during this request."""
+        return {}
 
     def get_field_name(self):
         """Extract the field name from the request.
@@ -131,7 +123,7 @@ class AutocompleteBaseView(View):
                 True
 
         """
-        return self.request_dict["field_name"]
+        return self.request.GET["field_name"]
 
     def get_hx_attrs(self):
         """Extract HTMX attributes from the request.
@@ -147,7 +139,7 @@ class AutocompleteBaseView(View):
                 True
 
         """
-        return self.request_dict.get("hx_attrs", {})
+        return self.request.GET.get("hx_attrs", {})
 
     def get_component_id(self):
         """Generate the component ID by combining prefix and field name.
@@ -180,6 +172,9 @@ class AutocompleteBaseView(View):
         Returns:
             The configuration value, or None if not found.
 
+        Notes:
+            Resolved values are memoised on the view instance, which lives for a single request.
+
 
         Examples:
             Inspect the public interface in an interactive session::
@@ -188,13 +183,20 @@ class AutocompleteBaseView(View):
                 True
 
         """
-        if key in self.request_dict:
-            return self.request.GET.get(key)
-
-        if key in AC_CLASS_CONFIGURABLE_VALUES and hasattr(self.ac_class, key):
-            return getattr(self.ac_class, key)
+        try:
+            return self._config_cache[key]
+        except KeyError:
+            pass
+
+        if key in self.request.GET:
+            value = self.request.GET.get(key)
+        elif key in AC_CLASS_CONFIGURABLE_VALUES:
+            value = getattr(self.ac_class, key, None)
+        else:
+            value = None
 
-        return None
+        self._config_cache[key] = value
+        return value
 
     def get_template_context(self):
         """Build the base template context for rendering autocomplete components.
@@ -213,28 +215,61 @@ class AutocompleteBaseView(View):
         """
         # many things will come from the request
         # others will be picked up from the AC class
+        ac_class = self.ac_class
+        value = self.get_configurable_value
 
         return {
-            "route_name": self.ac_class.route_name,
-            "ac_class": self.ac_class,
+            "route_name": ac_class.route_name,
+            "ac_class": ac_class,
             "field_name": self.get_field_name(),
             "component_id": self.get_component_id(),
-            "required": bool(self.get_configurable_value("required")),
-            "placeholder": self.get_configurable_value("placeholder"),
-            "indicator": self.get_configurable_value("indicator"),
-            "custom_strings": self.ac_class.get_custom_strings(),
-            "multiselect": bool(self.get_configurable_value("multiselect")),
-            "component_prefix": self.get_configurable_value("component_prefix"),
-            "disabled": bool(self.get_configurable_value("disabled")),
+            "required": bool(value("required")),
+            "placeholder": value("placeholder"),
+            "indicator": value("indicator"),
+            "custom_strings": ac_class.get_custom_strings(),
+            "multiselect": bool(value("multiselect")),
+            "component_prefix": value("component_prefix"),
+            "disabled": bool(value("disabled")),
             "hx_attrs": self.get_hx_attrs(),
         }
 
 
+def render_fragment(template_name, context):
+    """Render an autocomplete HTML fragment without running the context processors.
+
+    The fragments returned to HTMX only use the values supplied by the views, so rendering with a
+    plain context avoids the user, session, messages and constance lookups a RequestContext would make.
+
+    Args:
+        template_name (str):
+            The name of the template to render.
+        context (dict):
+            The template context.
+
+    Returns:
+        (HttpResponse): The response containing the rendered fragment.
+
+    Notes:
+        Templates are resolved through the configured loaders, which Django wraps in the cached loader
+        unless ``TEMPLATES["OPTIONS"]["loaders"]`` is set explicitly, so repeated renders reuse the
+        compiled template.
+
+    Examples:
+        Inspect the public interface in an interactive session::
+
+            >>> callable(render_fragment)
+            True
+
+    """
+    return HttpResponse(render_to_string(template_name, context))
+
+
 def toggle_set(_set, item):
     """Toggle an item's presence in a set.
 
-            If the item exists in the set (as itself or as a string), it is removed.
-            Otherwise, it is added to the set.
+            Members of the set and the item are compared as strings, since keys arrive from
+            the request as strings. If the item exists in the set it is removed, otherwise it
+            is added to the set.
 
     Args:
         _set (set):
@@ -243,7 +278,7 @@ def toggle_set(_set, item):
             The item to toggle.
 
     Returns:
-        (set): A new set with the item toggled.
+        (set): A new set of strings with the item toggled.
 
 
     Examples:
@@ -253,20 +288,8 @@ def toggle_set(_set, item):
             True
 
     """
-    s = _set.copy()
-
-    if item in s:
-        s.remove(item)
-
-    elif str(item) in s:
-        s.remove(str(item))
-
-    elif item in {str(x) for x in s}:
-        s = {x for x in s if str(x) != item}
-
-    else:
-        s.add(item)
-
+    s = set(map(str, _set))
+    s.symmetric_difference_update((str(item),))
     return s
 
 
@@ -300,12 +323,10 @@ def replace_or_toggle(_set, item):
     if len(_set) > 1:
         raise Exception("this function is only for sets with one item")
 
-    toggled = toggle_set(_set, item)
-
-    if len(toggled) > 1:
-        return {item}
-
-    return toggled
+    item = str(item)
+    if item in map(str, _set):
+        return set()
+    return {item}
 
 
 class ToggleView(AutocompleteBaseView):
@@ -358,10 +379,10 @@ class ToggleView(AutocompleteBaseView):
                 True
 
         """
-        field_name = self.request_dict["field_name"]
+        field_name = self.get_field_name()
 
         current_items = self.request.GET.getlist(field_name)
-        if current_items == ["undefined"] or current_items == [""]:
+        if len(current_items) == 1 and current_items[0] in EMPTY_SELECTION_VALUES:
             current_items = []
 
         key_to_toggle = request.GET.get("item")
@@ -387,63 +408,29 @@ class ToggleView(AutocompleteBaseView):
         # if it is currently in the dropdown list
         swap_oob = request.GET.get("remove", False)
 
-        target_item = next((x for x in items if x["key"] == key_to_toggle), None)
-
-        new_items = [x for x in items if x["key"] in new_selected_keys]
-
-        def sort_items(item):
-            """Perform the sort items operation.
-
-            Args:
-                item (object):
-                    Value supplied for ``item``.
-
-            Returns:
-                (object):
-                    The result of the operation.
+        items_by_key = {item["key"]: item for item in items}
+        target_item = items_by_key.get(key_to_toggle)
+        new_items = [items_by_key[key] for key in new_selected_keys if key in items_by_key]
 
-            Examples:
-                Inspect the public interface in an interactive session::
-
-                    >>> callable(ToggleView.sort_items)
-                    True
-
-            """
-            try:
-                return current_items.index(f"{item['key']}")
-            except ValueError:
-                return len(new_items)
-
-        new_items = sorted(new_items, key=sort_items)
+        # Keep the selected items in the order they were submitted, with new selections at the end
+        rank = {key: ix for ix, key in enumerate(current_items)}
+        unranked = len(new_items)
+        new_items.sort(key=lambda item: rank.get(str(item["key"]), unranked))
 
         if target_item is None:
             raise ValueError("Requested item to toggle not found.")
 
-        resp = render(
-            request,
-            "autocomplete/item.html",
-            {
-                **self.get_template_context(),
-                "search": "",
-                "values": new_selected_keys,
-                "item_as_list": [target_item],
-                "item": target_item,
-                "toggle": new_items,
-                "swap_oob": swap_oob,
-            },
-        )
-        resp.headers["HX-Trigger-After-Settle"] = json.dumps(
-            {
-                f"{field_name}_change": {
-                    "search": "",
-                    "values": list(new_selected_keys),
-                    "item_as_list": [target_item],
-                    "item": target_item,
-                    "toggle": new_items,
-                    "swap_oob": swap_oob,
-                }
-            }
-        )
+        # The same payload is rendered into the fragment and sent with the change event
+        payload = {
+            "search": "",
+            "values": list(new_selected_keys),
+            "item_as_list": [target_item],
+            "item": target_item,
+            "toggle": new_items,
+            "swap_oob": swap_oob,
+        }
+        resp = render_fragment("autocomplete/item.html", {**self.get_template_context(), **payload})
+        resp.headers["HX-Trigger-After-Settle"] = self.ac_class.dump_json({f"{field_name}_change": payload})
         return resp
 
 
@@ -480,6 +467,8 @@ class ItemsView(AutocompleteBaseView):
         Notes:
             Results are limited by the autocomplete class's max_results setting.
             Queries shorter than minimum_search_length return no results.
+            If the autocomplete class sets search_cache_timeout, the rendered results are
+            cached for that many seconds, keyed on the full query string.
 
 
         Keyword Parameters:
@@ -493,34 +482,33 @@ class ItemsView(AutocompleteBaseView):
                 True
 
         """
-        context_obj = ContextArg(request=request, client_kwargs=request.GET)
+        cache_timeout = self.ac_class.search_cache_timeout
+        if cache_timeout:
+            cache_key = self.get_cache_key()
+            content = cache.get(cache_key)
+            if content is not None:
+                return HttpResponse(content)
 
         search_query = request.GET.get("search", "")
-        search_results = self.ac_class.search_items(
-            # or whatever
-            search_query,
-            context_obj,
-        )
-
-        field_name = self.get_configurable_value("field_name")
-        selected_keys = request.GET.getlist(field_name)
-
         query_too_short = len(search_query) < self.ac_class.minimum_search_length
 
-        if query_too_short:
+        if query_too_short:  # Don't search at all until the query is long enough
             total_results = 0
-            search_results = []
+            items = []
 
         else:
+            context_obj = ContextArg(request=request, client_kwargs=request.GET)
+            search_results = self.ac_class.search_items(search_query, context_obj)
             total_results = len(search_results)
             if total_results > self.ac_class.max_results:
                 search_results = search_results[: self.ac_class.max_results]
 
-        items = self.ac_class.map_search_results(search_results, selected_keys)
+            field_name = self.get_configurable_value("field_name")
+            selected_keys = request.GET.getlist(field_name)
+            items = self.ac_class.map_search_results(search_results, selected_keys)
 
         # render items ...
-        return render(
-            request,
+        response = render_fragment(
             "autocomplete/item_list.html",
             {
                 # note: name -> field_name
@@ -533,3 +521,24 @@ class ItemsView(AutocompleteBaseView):
                 "minimum_search_length": self.ac_class.minimum_search_length,
             },
         )
+        if cache_timeout and not query_too_short:
+            cache.set(cache_key, response.content, cache_timeout)
+        return response
+
+    def get_cache_key(self):
+        """Build the cache key for the rendered search results of this request.
+
+        Returns:
+            (str): A key derived from the autocomplete route name, the active language and a digest
+                of the full query string, so that every parameter that can affect the results or their
+                rendering is part of the key.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(ItemsView.get_cache_key)
+                True
+
+        """
+        digest = hashlib.blake2b(self.request.GET.urlencode().encode(), digest_size=16).hexdigest()
+        return f"autocomplete:{self.ac_class.route_name}:{get_language()}:{digest}"
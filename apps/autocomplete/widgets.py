@@ -7,6 +7,7 @@ options for customising the autocomplete behaviour and appearance.
 
 # Django imports
 from django.forms import Widget
+from django.utils.functional import cached_property
 
 # app imports
 from .core import AC_CLASS_CONFIGURABLE_VALUES
@@ -75,6 +76,7 @@ class AutocompleteWidget(Widget):
             options = {}
 
         self.config = {}
+        self._resolved_config = {}
         for k, v in options.items():
             if k in self.configurable_values:
                 self.config[k] = v
@@ -124,8 +126,8 @@ class AutocompleteWidget(Widget):
     def value_omitted_from_data(self, data, files, name):
         """Check if the field value was omitted from the form data.
 
-                        For multi-select widgets, always returns an empty list since an unselected
-                        multi-select field doesn't appear in POST data.
+                        Always returns False since an unselected multi-select field doesn't
+                        appear in POST data.
 
         Args:
             data (QueryDict or dict):
@@ -136,7 +138,7 @@ class AutocompleteWidget(Widget):
                 The field name to check.
 
         Returns:
-            (list): Empty list indicating the field was not omitted.
+            (bool): False, indicating the field was not omitted.
 
 
         Examples:
@@ -148,7 +150,7 @@ class AutocompleteWidget(Widget):
         """
         # An unselected <select multiple> doesn't appear in POST data, so it's
         # never known if the value is actually omitted.
-        return []
+        return False
 
     def get_component_id(self, field_name):
         """Generate the component ID by combining prefix and field name.
@@ -185,6 +187,10 @@ class AutocompleteWidget(Widget):
         Returns:
             The configuration value, or None if not found.
 
+        Notes:
+            Resolved values are memoised on the widget, whose configuration is fixed once
+            it has been constructed.
+
 
         Examples:
             Inspect the public interface in an interactive session::
@@ -193,15 +199,22 @@ class AutocompleteWidget(Widget):
                 True
 
         """
-        if key in self.config:
-            return self.config.get(key)
+        try:
+            return self._resolved_config[key]
+        except KeyError:
+            pass
 
-        if key in AC_CLASS_CONFIGURABLE_VALUES and hasattr(self.ac_class, key):
-            return getattr(self.ac_class, key)
+        if key in self.config:
+            value = self.config.get(key)
+        elif key in AC_CLASS_CONFIGURABLE_VALUES:
+            value = getattr(self.ac_class, key, None)
+        else:
+            value = None
 
-        return None
+        self._resolved_config[key] = value
+        return value
 
-    @property
+    @cached_property
     def is_multi(self):
         """Determine if the widget is in multi-select mode.
 
@@ -246,13 +259,10 @@ class AutocompleteWidget(Widget):
 
         proper_attrs = self.build_attrs(self.attrs, attrs)
 
-        if value is None:
-            selected_options = []
-        else:
-            if self.is_multi:
-                selected_options = self.ac_class.get_items_from_keys(value, None)
-            else:
-                selected_options = self.ac_class.get_items_from_keys([value], None)
+        # Normalise single and multiple values to one list of keys and make one lookup for them all
+        keys = value if isinstance(value, (list, tuple, set)) else [value]
+        keys = [key for key in keys if key is not None and key != ""]
+        selected_options = self.ac_class.get_items_from_keys(keys, None) if keys else []
 
         context["ac_class"] = self.ac_class
         context["field_name"] = name
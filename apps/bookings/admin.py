@@ -11,6 +11,9 @@ from .forms import BookingEntryAdminForm
 from .models import BookingEntry, BookingPolicy
 from .resource import BookingEntryResource, BookingPolicyResource
 
+# Upper bound on the number of generated admin form classes kept per ModelAdmin
+ADMIN_FORM_CACHE_SIZE = 8
+
 
 @register(BookingEntry)
 class BookingtEntryAdmin(ImportExportModelAdmin):
@@ -35,10 +38,78 @@ class BookingtEntryAdmin(ImportExportModelAdmin):
         "equipment__name",
         "cost_centre__name",
         "cost_centre__short_name",
-        "coist_centre__account_code",
+        "cost_centre__account_code",
     )
     form = BookingEntryAdminForm
 
+    def __init__(self, *args, **kwargs):
+        """Set up the cache of generated admin form classes."""
+        super().__init__(*args, **kwargs)
+        self._form_cache = {}
+
+    def get_form(self, request, obj=None, change=False, **kwargs):
+        """Return the admin form class, reusing a previously generated class for the same permissions.
+
+                        ModelAdmin.get_form() runs modelform_factory - and so the whole ModelFormMetaclass field
+                        construction - on every request. The generated class only depends on the user's permissions,
+                        whether this is a change view and the list of fields, so it is cached on those.
+
+        Args:
+            request (HttpRequest):
+                The current request.
+            obj (BookingEntry):
+                The booking being edited, or None when adding.
+            change (bool):
+                True if the form is for a change view.
+            **kwargs:
+                Additional arguments for modelform_factory.
+
+        Returns:
+            (type):
+                A ModelForm subclass for BookingEntry.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingtEntryAdmin.get_form)
+                True
+
+        """
+        if not kwargs.keys() <= {"fields"} or not hasattr(request, "user"):
+            return super().get_form(request, obj, change, **kwargs)
+        fields = kwargs.get("fields")
+        key = (
+            frozenset(request.user.get_all_permissions()),
+            change,
+            None if fields is None else tuple(fields),
+        )
+        form = self._form_cache.get(key)
+        if form is None:
+            if len(self._form_cache) >= ADMIN_FORM_CACHE_SIZE:
+                self._form_cache.clear()
+            form = self._form_cache[key] = super().get_form(request, obj, change, **kwargs)
+        return form
+
+    def get_queryset(self, request):
+        """Load the policy context with the bookings so that list_editable saves do not query it per row.
+
+        Args:
+            request (HttpRequest):
+                The current request.
+
+        Returns:
+            (QuerySet):
+                The admin queryset of bookings.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingtEntryAdmin.get_queryset)
+                True
+
+        """
+        return BookingEntry.with_policy_context(super().get_queryset(request))
+
     def get_export_resource_class(self):
         """Return the impor-export resource class.
 
@@ -89,12 +160,13 @@ class BookingtEntryAdmin(ImportExportModelAdmin):
                 True
 
         """
-        start, end = obj.slot.lower, obj.slot.upper
+        slot = obj.slot
+        start, end = slot.lower, slot.upper
         if start is None or end is None:
             return "Bad slot"
         if start.date() == end.date():  # Simplified for start and end on same day
-            return start.strftime("%a %b %d %X") + " - " + end.strftime("%X %Y")
-        return start.strftime("%c") + " - " + end.strftime("%c")
+            return f"{start:%a %b %d %X} - {end:%X %Y}"
+        return f"{start:%c} - {end:%c}"
 
 
 @register(BookingPolicy)
@@ -109,10 +181,15 @@ class BookingPolicyAdmin(ImportExportModelAdmin):
 
     """
 
-    list_display = (
-        ["name", "for_role"] + BookingPolicy.weekdays + ["start_time", "end_time", "immutable", "max_forward"]
+    list_display = list_filter = (
+        "name",
+        "for_role",
+        *BookingPolicy.weekdays,
+        "start_time",
+        "end_time",
+        "immutable",
+        "max_forward",
     )
-    list_filter = list_display
     search_fields = (
         "name",
         "description",
@@ -5,10 +5,14 @@ This module provides Django form classes for managing equipment bookings,
 including booking entry forms, filtering forms, and custom widgets for
 date-time range selection.
 """
+# Python imports
+from types import MappingProxyType
+
 # Django imports
 from django import forms
 from django.contrib.auth.models import Group
 from django.contrib.postgres.forms import RangeWidget
+from django.utils.functional import cached_property
 
 # external imports
 from accounts.autocomplete import AllUsersComplete, UserListAutoComplete
@@ -23,6 +27,38 @@ from labman_utils.forms import DateCustomInput, DateTimeCustomInput
 # app imports
 from .models import BookingEntry
 
+# Grouping levels for sub-totalling booking reports
+REPORT_ORDER_CHOICES = (
+    ("user,equipment,cost_centre", "User, Equipment & Project"),
+    ("user,cost_centre,equipment", "User, Project & Equipment"),
+    ("cost_centre,user,equipment", "Project, User & Equipment"),
+    ("user_group,user,equipment", "User Group, User & Equipment"),
+    ("user_group,equipment,cost_centre", "User Group, Equipment & Project"),
+    ("user,equipment", "User & Equipment"),
+    ("user,cost_centre", "User & Project"),
+    ("equipment,cost_centre", "Equipment & Project"),
+    ("user_group,user", "User Group & User"),
+)
+
+# Output formats for booking reports
+REPORT_OUTPUT_CHOICES = (
+    ("html", "Web page"),
+    ("csv", "CSV File"),
+    ("xlsx", "Excel Spreadsheet"),
+    ("pdf", "PDF file"),
+    ("raw", "Raw records (Excel)"),
+)
+
+MULTISELECT_OPTIONS = MappingProxyType({"multiselect": True})
+
+# Decompressed value of an empty slot - immutable so that one instance can be shared by every widget
+EMPTY_SLOT = ((None, None), (None, None))
+
+
+def _multiselect_autocomplete(ac_class):
+    """Build a multi-select autocomplete widget for ac_class from the shared, read-only options."""
+    return AutocompleteWidget(ac_class=ac_class, options=MULTISELECT_OPTIONS)
+
 
 class CustomSlotWidget(RangeWidget):
     """A custom widget for entering booking time slots using date-time pickers.
@@ -59,13 +95,25 @@ class CustomSlotWidget(RangeWidget):
             **kargs: Arbitrary keyword arguments passed to parent class.
 
         """
-        if len(args) < 1:
-            args = (DateTimeCustomInput,)
-        if not issubclass(args[0], DateTimeCustomInput):
-            args = list(args)
-            args[0] = DateTimeCustomInput
+        if not args:  # Common case - no need to check the supplied widget
+            super().__init__(DateTimeCustomInput, **kargs)
+            return
+        base_widget = args[0]
+        base_class = base_widget if isinstance(base_widget, type) else type(base_widget)
+        if not issubclass(base_class, DateTimeCustomInput):
+            args = (DateTimeCustomInput, *args[1:])
         super().__init__(*args, **kargs)
 
+    @cached_property
+    def media(self):
+        """Merge the sub-widgets' media once per widget rather than on every access.
+
+        Returns:
+            (forms.Media): The combined media of the start and end sub-widgets.
+
+        """
+        return super().media
+
     def decompress(self, value):
         """Convert a date-time range to separate date and time components.
 
@@ -77,9 +125,8 @@ class CustomSlotWidget(RangeWidget):
             value: A datetime range object with lower and upper bounds, or None.
 
         Returns:
-            (list): A list containing two sublists, each with [date, time]
-                for the start and end of the range. Returns [[None, None],
-                [None, None]] if value is None or empty.
+            (tuple): Two [date, time] pairs for the start and end of the range.
+                Returns the shared EMPTY_SLOT tuple if value is None or empty.
 
 
         Examples:
@@ -89,10 +136,10 @@ class CustomSlotWidget(RangeWidget):
                 True
 
         """
-        if value:
-            start, end = value.lower, value.upper
-            return ([start.date(), start.time()], [end.date(), end.time()])
-        return [[None, None], [None, None]]
+        if not value:
+            return EMPTY_SLOT
+        start, end = value.lower, value.upper
+        return ([start.date(), start.time()], [end.date(), end.time()])
 
 
 class BookingEntryAdminForm(forms.ModelForm):
@@ -105,13 +152,12 @@ class BookingEntryAdminForm(forms.ModelForm):
 
     Attributes:
         Meta.model (BookingEntry): The model class for this form.
-        Meta.exclude (list): Fields excluded from the form (empty list, all
-            fields included).
+        Meta.fields (list): The editable BookingEntry fields, listed explicitly
+            in model order rather than built by introspecting the whole model.
         Meta.widgets (dict): Custom widgets for form fields, specifically the
             CustomSlotWidget for the slot field.
         Media.js (list): JavaScript files required for the form functionality,
-            including jQuery and jQuery UI.
-        Media.css (dict): CSS files required for styling the date-time pickers.
+            served locally from the copy of jQuery bundled with the Django admin.
 
 
     Examples:
@@ -126,7 +172,7 @@ class BookingEntryAdminForm(forms.ModelForm):
         """Configure the Meta class."""
 
         model = BookingEntry
-        exclude = []
+        fields = ["cost_centre", "charge", "comment", "user", "booker", "equipment", "slot", "shifts"]
         widgets = {
             "slot": CustomSlotWidget(),
         }
@@ -134,13 +180,12 @@ class BookingEntryAdminForm(forms.ModelForm):
     class Media:
         """Configure the Media class."""
 
-        js = ["https://code.jquery.com/jquery-3.7.1.min.js", "https://code.jquery.com/ui/1.14.1/jquery-ui.min.js"]
-        css = {
-            "all": [
-                "https://code.jquery.com/ui/1.14.1/themes/smoothness/jquery-ui.css",
-                "https://code.jquery.com/ui/1.14.1/themes/base/jquery-ui.css",
-            ]
-        }
+        # Use the admin's own jQuery so that it is served (with hashed names) from our static files and is merged
+        # with, rather than loaded in addition to, the ModelAdmin media. jquery.init.js moves it to django.jQuery,
+        # but nothing on this admin page uses the global $ or jQuery: the slot widget uses native datetime-local
+        # inputs, the other fields use the stock admin widgets and no admin templates are overridden. So neither
+        # jQuery UI nor its CSS is needed here.
+        js = ["admin/js/vendor/jquery/jquery.min.js", "admin/js/jquery.init.js"]
 
 
 class BookinngDialogForm(forms.ModelForm):
@@ -222,10 +267,13 @@ class BookingEntryFilterForm(forms.Form):
 
     from_date = forms.DateField(required=True, widget=DateCustomInput())
     to_date = forms.DateField(required=True, widget=DateCustomInput())
+    # The autocomplete widgets never iterate the choices, so these querysets are only evaluated to validate the
+    # submitted keys. The filters only need primary keys for users and equipment, but the cost centre tree fields
+    # are used to build the report filter.
     user = forms.ModelMultipleChoiceField(
-        Account.objects.all(),
+        Account.objects.only("pk"),
         required=False,
-        widget=AutocompleteWidget(options={"multiselect": True}, ac_class=AllUsersComplete),
+        widget=_multiselect_autocomplete(AllUsersComplete),
     )
     user_group = forms.ModelMultipleChoiceField(
         Group.objects.all(),
@@ -233,38 +281,16 @@ class BookingEntryFilterForm(forms.Form):
         widget=forms.SelectMultiple(attrs={"class": "form-control"}),
     )
     equipment = forms.ModelMultipleChoiceField(
-        Equipment.objects.all(),
+        Equipment.objects.only("pk"),
         required=False,
-        widget=AutocompleteWidget(options={"multiselect": True}, ac_class=EquipmentAutocomplete),
+        widget=_multiselect_autocomplete(EquipmentAutocomplete),
     )
 
     cost_centre = forms.ModelMultipleChoiceField(
         CostCentre.objects.all(),
         required=False,
-        widget=AutocompleteWidget(options={"multiselect": True}, ac_class=CostCentreAutocomplete),
-    )
-    order = forms.ChoiceField(
-        choices=[
-            ("user,equipment,cost_Centre", "User, Equipment & Project"),
-            ("user,cost_centre,equipment", "User, Project & Equipment"),
-            ("cost_centre,user,equipment", "Project, User & Equipment"),
-            ("user_group,user,equipment", "User Group, User & Equipment"),
-            ("user_group,equipment,cost_centre", "User Group, Equipment & Project"),
-            ("user,equipment", "User & Equipment"),
-            ("user,cost_centre", "User & Project"),
-            ("equipment,cost_centre", "Equipment & Project"),
-            ("user_group,user", "User Group & User"),
-        ],
-        help_text="Select the levels to sub-total usage",
+        widget=_multiselect_autocomplete(CostCentreAutocomplete),
     )
+    order = forms.ChoiceField(choices=REPORT_ORDER_CHOICES, help_text="Select the levels to sub-total usage")
     reverse = forms.BooleanField(help_text="Reverse the order for subtotals", required=False)
-    output = forms.ChoiceField(
-        choices=[
-            ("html", "Web page"),
-            ("csv", "CSV File"),
-            ("xlsx", "Excel Spreadsheet"),
-            ("pdf", "PDF file"),
-            ("raw", "Raw records (Excel)"),
-        ],
-        help_text="Output Format",
-    )
+    output = forms.ChoiceField(choices=REPORT_OUTPUT_CHOICES, help_text="Output Format")
@@ -0,0 +1,89 @@
+# Generated by Django 5.2 on 2026-10-17 10:00
+
+# Django imports
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+# external imports
+import labman_utils.models
+
+
+class Migration(migrations.Migration):
+
+    replaces = [
+        ("bookings", "0002_initial"),
+        ("bookings", "0003_alter_bookingpolicy_description"),
+        ("bookings", "0004_bookingentry_shifts"),
+        ("bookings", "0005_bookingentry_charge_bookingentry_cost_centre_and_more"),
+        ("bookings", "0006_remove_bookingentry_project"),
+        ("bookings", "0007_bookingentry_comment"),
+    ]
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("costings", "0001_initial"),
+        ("equipment", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("bookings", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bookingentry",
+            name="equipment",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="bookings",
+                to="equipment.equipment",
+            ),
+        ),
+        migrations.AddField(
+            model_name="bookingentry",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="bookings",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="bookingpolicy",
+            name="description",
+            field=labman_utils.models.ObfuscatedHTMLField(),
+        ),
+        migrations.AddField(
+            model_name="bookingentry",
+            name="shifts",
+            field=models.FloatField(default=1.0),
+        ),
+        migrations.AddField(
+            model_name="bookingentry",
+            name="charge",
+            field=models.FloatField(blank=True, default=0.0),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="bookingentry",
+            name="cost_centre",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_charges",
+                to="costings.costcentre",
+            ),
+        ),
+        migrations.AddField(
+            model_name="bookingentry",
+            name="ledger_date",
+            field=models.DateField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="bookingentry",
+            name="comment",
+            field=models.CharField(blank=True, max_length=80, null=True),
+        ),
+    ]
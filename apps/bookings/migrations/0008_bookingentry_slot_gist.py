@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-17 10:30
+
+# Django imports
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("bookings", "0002_squashed_0007_bookingentry_comment"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="bookingentry",
+            index=django.contrib.postgres.indexes.GistIndex(fields=["slot"], name="bookingentry_slot_gist"),
+        ),
+    ]
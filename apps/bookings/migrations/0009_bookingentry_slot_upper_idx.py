@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 11:15
+
+# Django imports
+import django.db.models.expressions
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("bookings", "0008_bookingentry_slot_gist"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="bookingentry",
+            index=models.Index(
+                django.db.models.expressions.Func(
+                    models.F("slot"), function="UPPER", output_field=models.DateTimeField()
+                ),
+                name="bookingentry_slot_upper_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-17 12:00
+
+# Django imports
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("bookings", "0009_bookingentry_slot_upper_idx"),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        AddIndexConcurrently(
+            model_name="bookingentry",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["equipment", "slot"], name="bookingentry_eq_slot_gist"
+            ),
+        ),
+    ]
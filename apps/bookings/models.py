@@ -7,23 +7,26 @@ as well as booking entries that represent actual equipment reservations. The mod
 several exception classes for handling various booking-related error conditions.
 """
 # Python imports
+from collections import defaultdict
 from datetime import datetime as dt, time, timedelta as td
+from functools import reduce
+from operator import or_
 
 # Django imports
 import django.utils.timezone as tz
 from django.contrib.postgres.fields import DateTimeRangeField
+from django.contrib.postgres.indexes import GistIndex
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Func, Prefetch, Q, Sum, prefetch_related_objects
+from django.utils.functional import cached_property
 
 # external imports
-import numpy as np
 from accounts.models import Account, Role
 from costings.models import ChargeableItem
-from equipment.models import Equipment
-from labman_utils.models import NamedObject, delta_t, ensure_tz, replace_time
-from numpy import ceil
+from equipment.models import Equipment, UserListEntry
+from labman_utils.models import DEFAULT_TZ, NamedObject, delta_t, ensure_tz, replace_time, to_seconds
 from psycopg2.extras import DateTimeTZRange
-from pytz import timezone
 
 
 class BookingError(ValidationError):
@@ -109,6 +112,32 @@ class AdminBookingHeld(BookingError):
     """
 
 
+def slots_overlap(first, second):
+    """Return whether two half-open booking slots overlap.
+
+    Args:
+        first (DateTimeTZRange):
+            A booking slot.
+        second (DateTimeTZRange):
+            Another booking slot.
+
+    Returns:
+        (bool):
+            True if the slots share any time - matches PostgreSQL's && for [) ranges. A missing bound is unbounded.
+
+
+    Examples:
+        Inspect the public interface in an interactive session::
+
+            >>> callable(slots_overlap)
+            True
+
+    """
+    return (first.lower is None or second.upper is None or first.lower < second.upper) and (
+        second.lower is None or first.upper is None or second.lower < first.upper
+    )
+
+
 class BookingPolicy(NamedObject):
     """Represent a policy about booking equipment.
 
@@ -167,7 +196,7 @@ class BookingPolicy(NamedObject):
         verbose_name = "Booking Policy"
         verbose_name_plural = "Booking Policies"
 
-    weekdays = ["mondays", "tuesdays", "wednesdays", "thursdays", "fridays", "saturdays", "sundays"]
+    weekdays = ("mondays", "tuesdays", "wednesdays", "thursdays", "fridays", "saturdays", "sundays")
 
     for_role = models.ForeignKey(Role, on_delete=models.PROTECT, related_name="booking_policies")
     booker_role = models.ForeignKey(Role, on_delete=models.PROTECT, related_name="booker_booking_policies")
@@ -186,6 +215,60 @@ class BookingPolicy(NamedObject):
     quota = models.DurationField(default=td(hours=48), null=True, blank=True)
     use_shifts = models.BooleanField(default=True)
 
+    @cached_property
+    def day_mask(self):
+        """Return whether bookings are allowed on each day of the week.
+
+        Returns:
+            (tuple of bool):
+                The mondays to sundays flags, indexed by datetime.weekday().
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> type(BookingPolicy.day_mask).__name__
+                'cached_property'
+
+        """
+        return tuple(getattr(self, day) for day in self.weekdays)
+
+    @cached_property
+    def start_secs(self):
+        """Return the policy start time as seconds after midnight.
+
+        Returns:
+            (int):
+                The number of seconds after midnight of start_time.
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> type(BookingPolicy.start_secs).__name__
+                'cached_property'
+
+        """
+        return to_seconds(self.start_time)
+
+    @cached_property
+    def quanta_secs(self):
+        """Return the quantisation period in seconds.
+
+        Returns:
+            (int):
+                The length of the quantisation period in whole seconds.
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> type(BookingPolicy.quanta_secs).__name__
+                'cached_property'
+
+        """
+        return int(self.quantisation.total_seconds())
+
     def applies(self, booking):
         """Return whether this booking policy applies to the user and equipment.
 
@@ -206,12 +289,12 @@ class BookingPolicy(NamedObject):
 
         """
         role = booking.user_role
-        if getattr(booking, "booker", None) is None or booking.booker.is_superuser:
-            return role and role.level >= self.for_role.level
+        if not role or role.level < self.for_role.level:  # Cheapest test and the commonest failure first
+            return False
+        if (booker := booking.booker) is None or booker.is_superuser:
+            return True
         booker_role = booking.booker_role
-        return (
-            role and role.level >= self.for_role.level and booker_role and booker_role.level >= self.booker_role.level
-        )
+        return bool(booker_role and booker_role.level >= self.booker_role.level)
 
     def rationalise(self, booking):
         """Apply quantisation to the booking.
@@ -264,18 +347,16 @@ class BookingPolicy(NamedObject):
         """
         start, end = booking.slot.lower, booking.slot.upper
         if start.tzinfo is None:
-            start = start.replace(tzinfo=timezone("Europe/London"))
-            end = end.replace(tzinfo=timezone("Europe/London"))
+            start = start.replace(tzinfo=DEFAULT_TZ)
+            end = end.replace(tzinfo=DEFAULT_TZ)
         start = min(start, end)
         end = max(start, end)
-        start_t = delta_t(start.time(), self.start_time).total_seconds()
-        end_t = delta_t(end.time(), self.start_time).total_seconds()
-        quanta = self.quantisation.total_seconds()
-        self_start_secs = self.start_time.hour * 3600 + self.start_time.minute * 60 + self.start_time.second
-        start_t = quanta * (start_t // quanta) + self_start_secs
-        end_t = quanta * ceil(end_t / quanta) + self_start_secs
-        start = replace_time(start, start_t)
-        end = replace_time(end, end_t)
+        # Work in whole seconds relative to the policy start time - a part second at the end rounds up
+        offset, quanta = self.start_secs, self.quanta_secs
+        start_t = to_seconds(start) - offset
+        end_t = to_seconds(end) - offset + (end.microsecond > 0)
+        start = replace_time(start, start_t // quanta * quanta + offset)
+        end = replace_time(end, -(-end_t // quanta) * quanta + offset)
         return start, end
 
     def fix_times(self, booking):
@@ -297,6 +378,7 @@ class BookingPolicy(NamedObject):
             When using shifts, the start time is aligned to the start of the shift containing
             the requested start time, and the end time is aligned to the end of the shift
             containing the requested end time. Day boundaries are crossed if necessary.
+            Results for saved policies are cached on the booking, keyed by policy and slot, until the next clean().
 
 
         Examples:
@@ -306,24 +388,35 @@ class BookingPolicy(NamedObject):
                 True
 
         """
-        start = booking.slot.lower + td(seconds=0.1)
-        end = booking.slot.upper - td(seconds=0.1)
-
-        if start_shift := booking.equipment.get_shift(start):
-            if delta_t(start, start_shift.start_time).total_seconds() < 0:
-                start -= td(days=1)
-            start = dt.combine(start.date(), start_shift.start_time)
+        # Each booking is fixed by the same policy several times while it is cleaned, so remember the results
+        fixed = booking.__dict__.setdefault("_fixed_times", {}) if self.pk else {}
+        key = (self.pk, booking.slot.lower, booking.slot.upper)
+        if key in fixed:
+            return fixed[key]
 
-        if end_shift := booking.equipment.get_shift(end):
-            if delta_t(end, end_shift.end_time).total_seconds() > 0:
-                end += td(days=1)
-            end = dt.combine(end.date(), end_shift.end_time)
-
-        if start_shift is None or end_shift is None:  # quantise the times
+        if not self.use_shifts or not booking.equipment.shift_list:  # Nothing to align to, so just quantise
             start, end = self.quantise(booking)
-        return ensure_tz(start), ensure_tz(end)
+        else:
+            start = booking.slot.lower + td(seconds=0.1)
+            end = booking.slot.upper - td(seconds=0.1)
+
+            if start_shift := booking.equipment.get_shift(start):
+                if delta_t(start, start_shift.start_time).total_seconds() < 0:
+                    start -= td(days=1)
+                start = dt.combine(start.date(), start_shift.start_time)
+
+            if end_shift := booking.equipment.get_shift(end):
+                if delta_t(end, end_shift.end_time).total_seconds() > 0:
+                    end += td(days=1)
+                end = dt.combine(end.date(), end_shift.end_time)
+
+            if start_shift is None or end_shift is None:  # quantise the times
+                start, end = self.quantise(booking)
+        start, end = ensure_tz(start), ensure_tz(end)
+        fixed[key] = fixed[(self.pk, start, end)] = (start, end)  # Fixed times stay fixed
+        return start, end
 
-    def permitted(self, booking):
+    def permitted(self, booking, check_quota=True):
         """Return whether the current policy permits the booking.
 
                         Validates that the booking satisfies all policy constraints including time ranges,
@@ -334,6 +427,10 @@ class BookingPolicy(NamedObject):
             booking (BookingEntry):
                 The booking entry to validate.
 
+        Keyword Parameters:
+            check_quota (bool):
+                Whether to check the user's booked time against the quota. Default is True.
+
         Returns:
             (bool):
                 True if the booking is permitted under this policy.
@@ -356,39 +453,38 @@ class BookingPolicy(NamedObject):
 
         """
         superuser = booking.booker.is_superuser
+        now = tz.now()
         if not self.applies(booking):  # Role doesn't apply
             raise PolicyDoesNotApply(f"This policy does not apply for {booking.user} or {booking.equipment}")
 
         # We need to fix the start and end times according to the policy before rationalising it
         start, end = self.fix_times(booking)
 
-        if (
-            not start.time() >= self.start_time and start.time() <= self.end_time
-        ):  # Start time outside policy time range
-            raise PolicyDoesNotApply(f"The start time {start.time()} does not fall within this policies range")
+        start_time = start.time()
+        if self.start_time <= self.end_time:
+            in_range = self.start_time <= start_time <= self.end_time
+        else:  # Policy runs overnight
+            in_range = start_time >= self.start_time or start_time <= self.end_time
+        if not in_range:  # Start time outside policy time range
+            raise PolicyDoesNotApply(f"The start time {start_time} does not fall within this policies range")
 
-        start_day = self.weekdays[start.date().weekday()]
-        if not getattr(self, start_day, False):  # Day outside policy day ranges
+        if not self.day_mask[start.weekday()]:  # Day outside policy day ranges
             raise PolicyDoesNotApply(f"The start day {start.date().strftime('%A')} is not covered by this policy")
 
-        if not superuser and self.immutable and tz.now() - self.immutable > start:  # Booking outside immutable time
+        if not superuser and self.immutable and now - self.immutable > start:  # Booking outside immutable time
             raise PolicyDoesNotApply("Start time is blocked by booking immutable time")
 
-        if not superuser and self.max_forward and tz.now() + self.max_forward < end:  # Booking  to far in advance
+        if not superuser and self.max_forward and now + self.max_forward < end:  # Booking  to far in advance
             raise PolicyDoesNotApply("End time is blocked by booking max_forward time")
 
-        entries = BookingEntry.objects.filter(
-            user=booking.user, equipment=booking.equipment, slot__fully_gt=DateTimeTZRange(tz.now(), tz.now())
-        ).values_list("slot")
-        total = np.sum([(x[0].upper - x[0].lower).total_seconds() for x in entries])
-
-        if not superuser and self.quota and total > self.quota.total_seconds():  # Too much time booked already
-            raise PolicyDoesNotApply("Too much time {total[0]['total']} already booked.")
+        if check_quota and not superuser and self.quota:  # Too much time booked already
+            if (total := booking.get_booked_time(now)) > self.quota:
+                raise PolicyDoesNotApply(f"Too much time {total} already booked.")
 
         return True
 
     @classmethod
-    def get_policy(cls, booking, no_holds=False):
+    def get_policy(cls, booking, no_holds=False, check_quota=True):
         """Try to locate the relevant booking policy for this booking.
 
                         Iterates through all policies associated with the equipment and returns the first
@@ -402,6 +498,9 @@ class BookingPolicy(NamedObject):
         Keyword Parameters:
             no_holds (bool):
                 Do not consider user or admin holds, e.g. for deleting bookings. Default is False.
+            check_quota (bool):
+                Whether policies should check the user's booked time against their quota, e.g. not for deleting
+                bookings. Default is True.
 
         Returns:
             (BookingPolicy):
@@ -436,9 +535,18 @@ class BookingPolicy(NamedObject):
         if booking.admin_hold and not no_holds:
             raise AdminBookingHeld(f"Bookings for {booking.user} or {booking.equipment} are blocked by the Admin")
 
-        for policy in booking.equipment.policies.all():
+        equipment = booking.equipment
+        if (role := booking.user_role) is None:  # No policy can apply to a user who is not on the userlist
+            policies = ()
+        elif "policies" in getattr(equipment, "_prefetched_objects_cache", {}):  # See with_policy_context()
+            policies = equipment.policies.all()
+        else:  # Only load policies that the user's role can satisfy (applies() checks the rest)
+            policies = equipment.policies.filter(for_role__level__lte=role.level).select_related(
+                "for_role", "booker_role"
+            )
+        for policy in policies:
             try:
-                if policy.permitted(booking):
+                if policy.permitted(booking, check_quota=check_quota):
                     return policy
             except (PolicyDoesNotApply, PolicyNotFound):
                 continue
@@ -482,6 +590,17 @@ class BookingEntry(ChargeableItem):
         """Configure the Meta class."""
 
         ordering = ["equipment", "slot"]
+        # Lets the slot__overlap lookups used for conflict checks, calendars and reports use an index scan
+        indexes = [
+            GistIndex(fields=["slot"], name="bookingentry_slot_gist"),
+            # Matches the per-equipment slot__overlap conflict check and calendar queries (needs btree_gist)
+            GistIndex(fields=["equipment", "slot"], name="bookingentry_eq_slot_gist"),
+            # Matches the slot__endswith (upper(slot)) comparison used for the booking quota
+            models.Index(
+                Func(F("slot"), function="UPPER", output_field=models.DateTimeField()),
+                name="bookingentry_slot_upper_idx",
+            ),
+        ]
         verbose_name = "Booking Slot"
         verbose_name_plural = "Booking Slots"
 
@@ -517,6 +636,124 @@ class BookingEntry(ChargeableItem):
         """
         return self.slot.upper - self.slot.lower
 
+    @classmethod
+    def with_policy_context(cls, queryset=None):
+        """Eager load everything needed to find and check the booking policy for each booking in a queryset.
+
+        Keyword Parameters:
+            queryset (QuerySet):
+                The bookings to load, defaults to all bookings.
+
+        Returns:
+            (QuerySet):
+                The queryset with the users, equipment, equipment policies (and their roles), equipment
+                userlists (and their roles) and equipment shifts loaded alongside, so that cleaning each booking in
+                turn does not query for them again.
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingEntry.with_policy_context)
+                True
+
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+        return queryset.select_related("equipment", "user", "booker").prefetch_related(*cls._policy_context_lookups())
+
+    @classmethod
+    def _policy_context_lookups(cls):
+        """Return the prefetch lookups for the equipment relations used when checking booking policies."""
+        return (
+            Prefetch("equipment__policies", queryset=BookingPolicy.objects.select_related("for_role", "booker_role")),
+            Prefetch("equipment__userlist", queryset=UserListEntry.objects.select_related("role")),
+            "equipment__shifts",
+        )
+
+    def get_membership(self, user_id):
+        """Return the equipment userlist entry for a user, looking it up at most once per booking.
+
+        Args:
+            user_id (int):
+                Primary key of the user (or None).
+
+        Returns:
+            (UserListEntry):
+                The user's entry on this booking's equipment userlist, or None if they are not on it.
+
+        Notes:
+            The role, hold and css properties are each read several times while a booking is cleaned, so the
+            entries are cached on the instance keyed by equipment and user - changing either picks up a fresh entry.
+            The booking's user and booker are looked up together in one query.
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingEntry.get_membership)
+                True
+
+        """
+        if user_id is None or self.equipment_id is None:
+            return None
+        memberships = self.__dict__.setdefault("_memberships", {})
+        key = (self.equipment_id, user_id)
+        if key not in memberships:
+            # Load the booking's user and booker together - policy checks always want both
+            wanted = {
+                pk
+                for pk in (user_id, self.user_id, self.booker_id)
+                if pk is not None and (self.equipment_id, pk) not in memberships
+            }
+            equipment = self.equipment
+            if "userlist" in getattr(equipment, "_prefetched_objects_cache", {}):  # See with_policy_context()
+                entries = {entry.user_id: entry for entry in equipment.userlist.all() if entry.user_id in wanted}
+            else:
+                entries = {
+                    entry.user_id: entry
+                    for entry in equipment.userlist.filter(user_id__in=wanted).select_related("role")
+                }
+            for pk in wanted:
+                memberships[(self.equipment_id, pk)] = entries.get(pk)
+        return memberships[key]
+
+    def get_booked_time(self, now=None):
+        """Return the time the user has booked on this equipment that has not yet finished, excluding this booking.
+
+        Keyword Parameters:
+            now (datetime):
+                The current time, defaults to tz.now().
+
+        Returns:
+            (timedelta):
+                The total length of the user's future and in-progress bookings on this equipment.
+
+        Notes:
+            Upcoming and in-progress bookings are exactly those whose slot ends after now, so a single upper(slot)
+            comparison - backed by an expression index - selects them.
+            Every policy checks its quota against the same total, so it is summed in the database once and cached
+            on the instance (keyed by equipment and user) until the next call to clean(). While bulk_clean() is
+            cleaning a batch, the total it summed for the whole batch is used instead.
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingEntry.get_booked_time)
+                True
+
+        """
+        booked = self.__dict__.setdefault("_booked_time", {})
+        key = (self.equipment_id, self.user_id)
+        if key in (batch := self.__dict__.get("_batch_booked", {})):  # See bulk_clean()
+            booked[key] = batch[key]
+        elif key not in booked:
+            booked[key] = BookingEntry.objects.filter(
+                user_id=self.user_id, equipment_id=self.equipment_id, slot__endswith__gt=now or tz.now()
+            ).exclude(pk=self.pk).aggregate(total=Sum(F("slot__endswith") - F("slot__startswith")))["total"] or td(0)
+        return booked[key]
+
     @property
     def booker_role(self):
         """Get the role of the person making the booking on this equipment.
@@ -533,9 +770,9 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
-        if self.equipment.userlist.filter(user=self.booker).count() == 0:
+        if (entry := self.get_membership(self.booker_id)) is None:
             return None
-        return self.equipment.userlist.get(user=self.booker).role
+        return entry.role
 
     @property
     def user_role(self):
@@ -553,9 +790,9 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
-        if self.equipment.userlist.filter(user=self.user).count() == 0:
+        if (entry := self.get_membership(self.user_id)) is None:
             return None
-        return self.equipment.userlist.get(user=self.user).role
+        return entry.role
 
     @property
     def calendar_css(self):
@@ -574,8 +811,8 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
-        if self.user_role:
-            return self.user_role.css
+        if role := self.user_role:
+            return role.css
         return "bg-gradient bg-danger text-white"
 
     @property
@@ -595,9 +832,9 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
-        if self.equipment.userlist.filter(user=self.user).count() == 0:
+        if (entry := self.get_membership(self.user_id)) is None:
             return True
-        return self.equipment.userlist.get(user=self.user).hold
+        return entry.hold
 
     @property
     def admin_hold(self):
@@ -616,9 +853,9 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
-        if self.equipment.userlist.filter(user=self.user).count() == 0:
+        if (entry := self.get_membership(self.user_id)) is None:
             return True
-        return self.equipment.userlist.get(user=self.user).admin_hold
+        return entry.admin_hold
 
     @property
     def policy(self):
@@ -629,6 +866,9 @@ class BookingEntry(ChargeableItem):
                 The booking policy that applies to this booking, or a string error message
                 if no policy can be determined.
 
+        Notes:
+            Reuses the policy found by the last call to clean(), if any, rather than searching the policies again.
+
 
         Examples:
             Inspect the public interface in an interactive session::
@@ -637,6 +877,8 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
+        if "_cached_policy" in self.__dict__:
+            return self._cached_policy
         return self.get_policy()
 
     def calculate_charge(self):
@@ -748,7 +990,9 @@ class BookingEntry(ChargeableItem):
         if self.slot.isempty or policy is None:  # Bugout for the empty slot or no policy
             return self
         start, end = policy.fix_times(self)
-        self.slot = DateTimeTZRange(start, end)
+        slot = self.slot
+        if (start, end) != (slot.lower, slot.upper) or not slot.lower_inc or slot.upper_inc:  # Already fixed?
+            self.slot = DateTimeTZRange(start, end)
         return self
 
     def fix_project(self):
@@ -772,19 +1016,22 @@ class BookingEntry(ChargeableItem):
         """
         if not self.user_id:
             return None
-        if self.user.project.count() == 0:
-            return None
-        if getattr(self, "cost_centre", None) is None:
-            self.cost_centre = self.user.default_project
-        if self.cost_centre not in self.user.project.all() and not self.user.is_superuser:
+        if self.cost_centre_id is None:
+            self.cost_centre = self.user.default_project  # Stays None if the user has no projects
+        elif not self.user.is_superuser and not self.user.project.filter(pk=self.cost_centre_id).exists():
             return self.user.default_project
+        return None
 
-    def count_shifts(self):
+    def count_shifts(self, policy=None):
         """Return a weighted sum of the number of shifts for this booking.
 
                         Calculates the total weighted shift count by iterating through the equipment's
                         shift schedule and summing the weightings of all shifts covered by the booking.
 
+        Keyword Parameters:
+            policy (BookingPolicy):
+                The effective policy if already known, otherwise it is looked up (ignoring holds).
+
         Returns:
             (float):
                 The weighted sum of shifts, or None if no policy can be determined.
@@ -801,22 +1048,27 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
-        if not (policy := self.get_policy(no_holds=True)):
+        if policy is None:
+            policy = self.get_policy(no_holds=True)
+        if not policy:
             return None
         start, end = policy.fix_times(self)
         end = end - td(seconds=0.1)  # knock the end back inside a shift
         start_shift = self.equipment.get_shift(start)
-        shifts = [x for x in self.equipment.shifts.all()]
-        ix = shifts.index(start_shift)
-        current = start
+        durations, weightings, positions = self.equipment.shift_cycle
+        ix = positions[start_shift.pk]
+        remaining = end - start
         total = 0
-        while (end - current).total_seconds() >= 0:
-            current = current + shifts[ix].duration
-            total += shifts[ix].weighting
-            ix = (ix + 1) % len(shifts)
+        if (cycle := sum(durations, td(0))) and (laps := remaining // cycle):  # Skip whole turns of the cycle
+            remaining -= laps * cycle
+            total += laps * sum(weightings)
+        while remaining >= td(0):
+            remaining -= durations[ix]
+            total += weightings[ix]
+            ix = (ix + 1) % len(durations)
         return total
 
-    def clean(self, no_holds=False):
+    def clean(self, no_holds=False, check_conflicts=True):
         """Rearrange the slot and check for conflicts.
 
                         Performs comprehensive validation of the booking including fixing the cost centre,
@@ -826,6 +1078,9 @@ class BookingEntry(ChargeableItem):
         Keyword Parameters:
             no_holds (bool):
                 If True, ignore user and admin hold statuses during validation. Default is False.
+            check_conflicts (bool):
+                If False, skip the check for overlapping bookings - used by bulk_clean() which checks a whole
+                batch in one query. Default is True.
 
         Raises:
             ValidationError:
@@ -853,6 +1108,9 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
+        self.__dict__.pop("_cached_policy", None)
+        self.__dict__.pop("_booked_time", None)
+        self.__dict__.pop("_fixed_times", None)
         self.fix_project()
         # Swap start and end times to ensure positive duration
         if self.slot and not self.slot.isempty and self.slot.lower > self.slot.upper:
@@ -860,19 +1118,19 @@ class BookingEntry(ChargeableItem):
         if (
             self.slot and not self.slot.isempty and self.user.username != "service"
         ):  # Can't do the custom cleaning if slot is blank
-            policy = BookingPolicy.get_policy(self, no_holds=no_holds)
+            policy = self._cached_policy = BookingPolicy.get_policy(self, no_holds=no_holds)
             self.rationalise(policy)
             if not self.booker.is_superuser and not policy.permitted(self):
                 raise ValidationError("Booking is unable to be made after quantising the booking period")
             conflicts = BookingEntry.objects.filter(slot__overlap=self.slot, equipment=self.equipment).exclude(
                 pk=self.pk
             )
-            if conflicts.count() > 0:
+            if check_conflicts and conflicts.exists():
                 raise ValidationError(
                     "Unable to save the booking entry due to overlapping entry for the same equipment"
                 )
             if policy:
-                self.shifts = self.count_shifts()
+                self.shifts = self.count_shifts(policy)
         elif (
             self.user_id and self.user and self.user.username == "service"
         ):  # Special case, service user always booked!
@@ -881,6 +1139,101 @@ class BookingEntry(ChargeableItem):
             raise ValidationError("No booking slot defined!")
         return super().clean()
 
+    @classmethod
+    def bulk_clean(cls, entries, no_holds=False):
+        """Clean a batch of bookings, checking them all for overlaps with a single query.
+
+                        Each booking is cleaned as by clean(), except that the conflict check is done once for
+                        the whole batch - against the existing bookings and against the other bookings in the
+                        batch. The bookings can then be saved with ``save(force_clean=None)``. The equipment
+                        policies, userlists and shifts are prefetched for the whole batch first, and the time
+                        each user has booked is summed for the whole batch in one query.
+
+        Args:
+            entries (iterable of BookingEntry):
+                The bookings to clean.
+
+        Keyword Parameters:
+            no_holds (bool):
+                If True, ignore user and admin hold statuses during validation. Default is False.
+
+        Returns:
+            (list of BookingEntry):
+                The cleaned bookings.
+
+        Raises:
+            ValidationError:
+                If any booking fails to clean, or with one message for each booking that overlaps another.
+
+        Notes:
+            As save() does for a single booking, the equipment rows of the batch are locked (SELECT ... FOR UPDATE)
+            before the conflict check, so this must be called inside a ``transaction.atomic()`` block that also
+            saves the bookings - otherwise another booking could be saved between the check and the saves.
+            Quotas are checked as if the bookings were saved one at a time in order, so each booking's quota
+            also counts the unfinished bookings before it in the batch.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingEntry.bulk_clean)
+                True
+
+        """
+        entries = list(entries)
+        # Lock in pk order so that two batches sharing equipment cannot deadlock
+        if equipment_ids := sorted({entry.equipment_id for entry in entries if entry.equipment_id}):
+            list(Equipment.objects.select_for_update().filter(pk__in=equipment_ids).order_by("pk").values_list("pk"))
+        # Load each equipment's policies, userlist and shifts once for the batch rather than once per booking
+        prefetch_related_objects(entries, "equipment", "user", "booker", *cls._policy_context_lookups())
+        now = tz.now()
+        booked_time = defaultdict(td)
+        if pairs := {(entry.equipment_id, entry.user_id) for entry in entries if entry.equipment_id and entry.user_id}:
+            mine = reduce(or_, (Q(equipment_id=equipment_id, user_id=user_id) for equipment_id, user_id in pairs))
+            for equipment_id, user_id, total in (
+                cls.objects.filter(mine, slot__endswith__gt=now)
+                .exclude(pk__in=[entry.pk for entry in entries if entry.pk])
+                .order_by()
+                .values("equipment_id", "user_id")
+                .annotate(total=Sum(F("slot__endswith") - F("slot__startswith")))
+                .values_list("equipment_id", "user_id", "total")
+            ):
+                booked_time[equipment_id, user_id] = total
+        try:
+            for entry in entries:
+                key = (entry.equipment_id, entry.user_id)
+                entry.__dict__["_batch_booked"] = {key: booked_time[key]}  # Read by get_booked_time()
+                entry.clean(no_holds=no_holds, check_conflicts=False)
+                if entry.slot and not entry.slot.isempty and entry.slot.upper and ensure_tz(entry.slot.upper) > now:
+                    # The rest of the batch counts this booking against its quota, as if it had already been saved
+                    booked_time[key] += entry.slot.upper - entry.slot.lower
+        finally:
+            for entry in entries:
+                entry.__dict__.pop("_batch_booked", None)
+        checked = [
+            entry for entry in entries if entry.slot and not entry.slot.isempty and entry.user.username != "service"
+        ]
+        if not checked:
+            return entries
+        overlaps = reduce(or_, (Q(equipment_id=entry.equipment_id, slot__overlap=entry.slot) for entry in checked))
+        booked = defaultdict(list)
+        for equipment_id, slot in (
+            cls.objects.filter(overlaps)
+            .exclude(pk__in=[entry.pk for entry in checked if entry.pk])
+            .values_list("equipment_id", "slot")
+        ):
+            booked[equipment_id].append(slot)
+        errors = []
+        for entry in checked:
+            slots = booked[entry.equipment_id]
+            if any(slots_overlap(entry.slot, slot) for slot in slots):
+                errors.append(
+                    ValidationError(f"Unable to save {entry} due to an overlapping entry for the same equipment")
+                )
+            slots.append(entry.slot)  # Later bookings in the batch must not overlap this one either
+        if errors:
+            raise ValidationError(errors)
+        return entries
+
     def save(
         self,
         *args,
@@ -907,7 +1260,10 @@ class BookingEntry(ChargeableItem):
 
         Notes:
             Django models do not automatically call clean() during save, so this override
-            ensures validation always occurs.
+            ensures validation always occurs. The equipment row is locked (SELECT ... FOR UPDATE) while the
+            booking is cleaned and saved, so two concurrent bookings cannot both pass the overlap check.
+            ``force_clean=None`` skips both the clean and the lock - it is for bookings already checked by
+            bulk_clean(), which holds the locks until the end of the transaction it was called in.
 
 
         Args:
@@ -929,15 +1285,21 @@ class BookingEntry(ChargeableItem):
                 True
 
         """
-        if force_clean is not None:
-            self.clean(no_holds=force_clean)
-        super().save(
-            *args,
-            force_insert=force_insert,
-            force_update=force_update,
-            using=using,
-            update_fields=update_fields,
-        )
+        with transaction.atomic(using=using):
+            if force_clean is not None:
+                # Lock the equipment so that no other booking of it can be saved between our clean and save
+                if self.equipment_id:
+                    Equipment.objects.using(using).select_for_update().filter(pk=self.equipment_id).values_list(
+                        "pk", flat=True
+                    ).first()
+                self.clean(no_holds=force_clean)
+            super().save(
+                *args,
+                force_insert=force_insert,
+                force_update=force_update,
+                using=using,
+                update_fields=update_fields,
+            )
 
     def delete(self, using=None, keep_parents=False, force=True):
         """Check whether we can delete this object.
@@ -959,9 +1321,9 @@ class BookingEntry(ChargeableItem):
                 Django's standard deletion result tuple (number_deleted, deletion_details_dict).
 
         Notes:
-            When force is False, retrieves the booking policy with no_holds=True to verify
-            the deletion is permitted, though the current implementation always proceeds
-            with deletion after policy retrieval.
+            When force is False, looks up the booking policy with no_holds=True to verify the
+            deletion is permitted - a BookingError from the lookup blocks the deletion. The quota
+            is not checked, since deleting a booking can only reduce the time booked.
 
 
         Args:
@@ -981,5 +1343,5 @@ class BookingEntry(ChargeableItem):
         """
         if force:
             return super().delete(using=using, keep_parents=keep_parents)
-        BookingPolicy.get_policy(self, no_holds=True)
+        BookingPolicy.get_policy(self, no_holds=True, check_quota=False)
         return super().delete(using=using, keep_parents=keep_parents)
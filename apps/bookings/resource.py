@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 """Import Export Resources for bookings."""
+# Django imports
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.functional import cached_property
+
 # external imports
 from accounts.models import Account, Role
 from accounts.resource import AccountWidget
@@ -11,6 +16,80 @@ from import_export import fields, resources, widgets
 from .models import BookingEntry, BookingPolicy
 
 
+class LookupForeignKeyWidget(widgets.ForeignKeyWidget):
+    """A ForeignKeyWidget that matches values against the whole related table, loaded once.
+
+    Examples:
+        Inspect the public interface in an interactive session::
+
+            >>> LookupForeignKeyWidget.__name__
+            'LookupForeignKeyWidget'
+
+    """
+
+    def clean(self, value, row=None, **kwargs):
+        """Return the related object for value, falling back to the usual query if it is not in the lookup table.
+
+        Args:
+            value (object):
+                Value supplied for ``value``.
+            row (object):
+                Value supplied for ``row``.
+        Keyword Parameters:
+            **kwargs (object):
+                Value supplied for ``kwargs``.
+
+        Returns:
+            (Model or None):
+                The matching object, or None if value is empty.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(LookupForeignKeyWidget.clean)
+                True
+
+        """
+        if value and (obj := self._lookup.get(value)) is not None:
+            return obj
+        return super().clean(value, row, **kwargs)
+
+    def prime(self, values):
+        """Load only the related objects named in values, ready for clean(), instead of the whole related table.
+
+        Args:
+            values (iterable):
+                The values that clean() is about to be called with, e.g. a column of an import dataset.
+
+        Notes:
+            If any value cannot be used to filter the related table, nothing is primed and clean() reports the bad
+            value for its row.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(LookupForeignKeyWidget.prime)
+                True
+
+        """
+        values = {value for value in values if value}
+        try:
+            objs = list(self.model.objects.filter(**{f"{self.field}__in": values}))
+        except (TypeError, ValueError, ValidationError):
+            return
+        by_key = {str(getattr(obj, self.field)): obj for obj in objs}
+        self._lookup = {value: by_key.get(str(value)) for value in values}
+
+    @cached_property
+    def _lookup(self):
+        """Map each related object's field value to the object for the lifetime of the widget.
+
+        import-export copies the resource fields, and so their widgets, for each import, so the related table is
+        read once per import rather than queried once per row.
+        """
+        return {getattr(obj, self.field): obj for obj in self.model.objects.only("pk", self.field)}
+
+
 class BookingEntryResource(resources.ModelResource):
     """Import export resource for BookingEntry objects.
 
@@ -27,15 +106,103 @@ class BookingEntryResource(resources.ModelResource):
 
         model = BookingEntry
         import_id_fields = ["id"]
+        # Bookings are cleaned as a batch in after_import(), so full_clean() must not clean them again row by row
+        clean_model_instances = False
 
     user = fields.Field(column_name="user", attribute="user", widget=AccountWidget(Account, "username"))
+    # Bookers are exported and imported by primary key, as they always have been
+    booker = fields.Field(column_name="booker", attribute="booker", widget=LookupForeignKeyWidget(Account, "pk"))
     equipment = fields.Field(
-        column_name="equipment", attribute="equipment", widget=widgets.ForeignKeyWidget(Equipment, "name")
+        column_name="equipment", attribute="equipment", widget=LookupForeignKeyWidget(Equipment, "name")
     )
     cost_centre = fields.Field(
-        column_name="cost_centre", attribute="cost_Centre", widget=widgets.ForeignKeyWidget(CostCentre, "short_name")
+        column_name="cost_centre", attribute="cost_centre", widget=LookupForeignKeyWidget(CostCentre, "short_name")
     )
 
+    def __init__(self, **kwargs):
+        """Start with no bookings waiting to be saved."""
+        super().__init__(**kwargs)
+        self._pending = []
+
+    def before_import(self, dataset, *args, **kwargs):
+        """Look up all the users and bookers named in the dataset before the rows are imported.
+
+        Args:
+            dataset (Dataset):
+                The data being imported.
+            *args (object):
+                Value supplied for ``args``.
+        Keyword Parameters:
+            **kwargs (object):
+                Value supplied for ``kwargs``.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingEntryResource.before_import)
+                True
+
+        """
+        for name in ("user", "booker"):
+            if name in (dataset.headers or []):
+                self.fields[name].widget.prime(dataset[name])
+        return super().before_import(dataset, *args, **kwargs)
+
+    def do_instance_save(self, instance, is_create):
+        """Hold the booking back so that the whole import can be checked at once in after_import().
+
+        Args:
+            instance (BookingEntry):
+                The booking built from the row.
+            is_create (bool):
+                True if the booking is new.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingEntryResource.do_instance_save)
+                True
+
+        """
+        self._pending.append(instance)
+
+    def after_import(self, dataset, result, **kwargs):
+        """Check all the imported bookings with BookingEntry.bulk_clean() and then save them.
+
+        Args:
+            dataset (Dataset):
+                The data being imported.
+            result (Result):
+                The result of the import so far.
+
+        Keyword Parameters:
+            **kwargs (object):
+                Value supplied for ``kwargs``.
+
+        Raises:
+            ValidationError:
+                If any of the bookings fails to clean or overlaps another, in which case none of them is saved.
+
+        Notes:
+            Saving row by row would clean each booking with its own overlap, policy and quota queries. The
+            bookings are instead checked in a single batch under the equipment locks taken by bulk_clean(), and
+            saved in the same transaction with ``save(force_clean=None)`` so they are not cleaned again. As with a
+            bulk import, the row results of new bookings do not carry their primary keys.
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingEntryResource.after_import)
+                True
+
+        """
+        entries, self._pending = self._pending, []
+        if entries:
+            with transaction.atomic():
+                for entry in BookingEntry.bulk_clean(entries):
+                    entry.save(force_clean=None)
+        return super().after_import(dataset, result, **kwargs)
+
 
 class BookingPolicyResource(resources.ModelResource):
     """Import-export resource for BookingPolicy objects.
@@ -53,6 +220,9 @@ class BookingPolicyResource(resources.ModelResource):
 
         model = BookingPolicy
         import_id_fields = ["id"]
+        # Policies have no save() logic or signal handlers, so imported rows can be written in bulk
+        use_bulk = True
+        batch_size = 1000
 
     for_role = fields.Field(
         column_name="for_role", attribute="for_role", widget=widgets.ForeignKeyWidget(Role, "name")
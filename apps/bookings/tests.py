@@ -6,12 +6,12 @@ policy creation, string representations, and exception class hierarchy,
 as well as the bookings views.
 """
 # Python imports
-from datetime import time, timedelta
+from datetime import datetime, time, timedelta
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 # Django imports
-from django.urls import reverse
+from django.urls import resolve, reverse
 
 # external imports
 import pytest
@@ -76,6 +76,361 @@ class TestBookingPolicy:
         """use_shifts defaults to True."""
         assert booking_policy.use_shifts is True
 
+    @pytest.mark.parametrize(
+        "policy_times,start_hour,allowed",
+        [
+            ((9, 18), 10, True),
+            ((9, 18), 7, False),
+            ((9, 18), 21, False),
+            ((18, 9), 21, True),
+            ((18, 9), 7, True),
+            ((18, 9), 12, False),
+        ],
+    )
+    def test_permitted_checks_start_time_range(self, policy_times, start_hour, allowed):
+        """permitted only accepts bookings that start inside the policy's (possibly overnight) time range."""
+        # external imports
+        from bookings.models import BookingPolicy, PolicyDoesNotApply
+
+        policy = BookingPolicy(start_time=time(policy_times[0]), end_time=time(policy_times[1]))
+        start = datetime(2024, 1, 2, start_hour)
+        booking = SimpleNamespace(booker=SimpleNamespace(is_superuser=True))
+        with (
+            patch.object(BookingPolicy, "applies", return_value=True),
+            patch.object(BookingPolicy, "fix_times", return_value=(start, start + timedelta(hours=1))),
+        ):
+            if allowed:
+                assert policy.permitted(booking)
+            else:
+                with pytest.raises(PolicyDoesNotApply):
+                    policy.permitted(booking)
+
+    def test_applies_checks_user_role_first(self):
+        """applies rejects an under-qualified user before considering the booker."""
+        # external imports
+        from bookings.models import BookingPolicy
+
+        policy = SimpleNamespace(for_role=SimpleNamespace(level=2), booker_role=SimpleNamespace(level=2))
+        booking = Mock(user_role=SimpleNamespace(level=1), booker=SimpleNamespace(is_superuser=False))
+        assert BookingPolicy.applies(policy, booking) is False
+        booking.user_role = None
+        assert BookingPolicy.applies(policy, booking) is False
+        booking.user_role = SimpleNamespace(level=2)
+        booking.booker_role = SimpleNamespace(level=3)
+        assert BookingPolicy.applies(policy, booking) is True
+        booking.booker = SimpleNamespace(is_superuser=True)
+        booking.booker_role = None
+        assert BookingPolicy.applies(policy, booking) is True
+
+    def test_fix_times_without_shifts_quantises(self):
+        """fix_times quantises without looking for shifts when the policy does not use them."""
+        # external imports
+        from bookings.models import BookingPolicy
+
+        policy = BookingPolicy(start_time=time(9, 0), quantisation=timedelta(hours=3), use_shifts=False)
+        equipment = Mock(shift_list=[Mock()])
+        start, end = datetime(2024, 1, 2, 10, 15), datetime(2024, 1, 2, 13, 10)
+        booking = SimpleNamespace(equipment=equipment, slot=SimpleNamespace(lower=start, upper=end))
+        new_start, new_end = policy.fix_times(booking)
+        assert (new_start.time(), new_end.time()) == (time(9, 0), time(15, 0))
+        equipment.get_shift.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_fix_times_remembered_on_booking(self, booking_policy):
+        """fix_times works out a saved policy's times for a slot once per booking, including the fixed slot."""
+        # external imports
+        from bookings.models import BookingPolicy
+
+        start, end = datetime(2024, 1, 2, 10, 15), datetime(2024, 1, 2, 13, 10)
+        booking = SimpleNamespace(equipment=Mock(shift_list=[]), slot=SimpleNamespace(lower=start, upper=end))
+        with patch.object(BookingPolicy, "quantise", wraps=booking_policy.quantise) as quantise:
+            fixed = booking_policy.fix_times(booking)
+            assert booking_policy.fix_times(booking) == fixed
+            booking.slot = SimpleNamespace(lower=fixed[0], upper=fixed[1])
+            assert booking_policy.fix_times(booking) == fixed
+        assert quantise.call_count == 1
+
+    def test_day_mask_follows_weekday_flags(self):
+        """day_mask holds the weekday flags in datetime.weekday() order."""
+        # external imports
+        from bookings.models import BookingPolicy
+
+        policy = BookingPolicy(saturdays=False, sundays=False)
+        assert policy.day_mask == (True, True, True, True, True, False, False)
+
+    @pytest.mark.parametrize(
+        "start,end,expected_start,expected_end",
+        [
+            (datetime(2024, 1, 2, 10, 15), datetime(2024, 1, 2, 13, 10), time(9, 0), time(15, 0)),
+            (datetime(2024, 1, 2, 9, 0), datetime(2024, 1, 2, 12, 0), time(9, 0), time(12, 0)),
+            (datetime(2024, 1, 2, 9, 0), datetime(2024, 1, 2, 12, 0, 0, 500), time(9, 0), time(15, 0)),
+        ],
+    )
+    def test_quantise_rounds_out_to_quanta(self, start, end, expected_start, expected_end):
+        """quantise rounds the start down and the end up to the policy's quanta from its start time."""
+        # external imports
+        from bookings.models import BookingPolicy
+
+        policy = BookingPolicy(start_time=time(9, 0), quantisation=timedelta(hours=3))
+        booking = SimpleNamespace(slot=SimpleNamespace(lower=start, upper=end))
+        new_start, new_end = policy.quantise(booking)
+        assert (new_start.date(), new_start.time()) == (start.date(), expected_start)
+        assert (new_end.date(), new_end.time()) == (end.date(), expected_end)
+
+
+class TestBookingEntry:
+    """Tests for the BookingEntry model."""
+
+    @pytest.fixture
+    def membership(self, db, equipment, regular_user, role_trainee):
+        """Put regular_user on the equipment userlist as a trainee.
+
+        Returns:
+            (UserListEntry): The saved userlist entry.
+
+        """
+        # external imports
+        from equipment.models import UserListEntry
+
+        return UserListEntry.objects.create(equipment=equipment, user=regular_user, role=role_trainee)
+
+    @pytest.mark.django_db
+    def test_membership_properties_share_one_query(
+        self, django_assert_num_queries, equipment, regular_user, role_trainee, membership
+    ):
+        """Verify that role, hold and css lookups reuse a single userlist query."""
+        # external imports
+        from bookings.models import BookingEntry
+
+        booking = BookingEntry(user=regular_user, booker=regular_user, equipment=equipment)
+        with django_assert_num_queries(1):
+            assert booking.user_role == role_trainee
+            assert booking.booker_role == role_trainee
+            assert booking.user_hold == membership.hold
+            assert booking.admin_hold == membership.admin_hold
+            assert booking.calendar_css == role_trainee.css
+
+    @pytest.mark.django_db
+    def test_user_and_booker_memberships_share_one_query(
+        self, django_assert_num_queries, equipment, regular_user, superuser, role_trainee, membership
+    ):
+        """Verify that the user's and booker's userlist entries are fetched together."""
+        # external imports
+        from bookings.models import BookingEntry
+
+        booking = BookingEntry(user=regular_user, booker=superuser, equipment=equipment)
+        with django_assert_num_queries(1):
+            assert booking.user_role == role_trainee
+            assert booking.booker_role is None
+
+    @pytest.mark.django_db
+    def test_policy_context_prefetches_membership(
+        self, django_assert_num_queries, equipment, regular_user, role_trainee, membership
+    ):
+        """Verify that bookings loaded with their policy context read roles without further queries."""
+        # external imports
+        from bookings.models import BookingEntry
+
+        with patch.object(BookingEntry, "clean"), patch.object(BookingEntry, "calculate_charge", return_value=0.0):
+            BookingEntry.objects.create(
+                user=regular_user,
+                booker=regular_user,
+                equipment=equipment,
+                slot=(datetime(2024, 1, 2, 9, 0), datetime(2024, 1, 2, 12, 0)),
+                charge=0.0,
+            )
+        (booking,) = BookingEntry.with_policy_context()
+        with django_assert_num_queries(0):
+            assert booking.user_role == role_trainee
+            assert list(booking.equipment.policies.all()) == []
+
+    @pytest.mark.django_db
+    def test_booked_time_summed_once(self, django_assert_num_queries, equipment, regular_user):
+        """Verify that unfinished booked time is summed in one query and reused by later policy checks."""
+        # Django imports
+        from django.utils import timezone
+
+        # external imports
+        from bookings.models import BookingEntry
+
+        now = timezone.now()
+        with patch.object(BookingEntry, "clean"), patch.object(BookingEntry, "calculate_charge", return_value=0.0):
+            for offset in (-48, -1, 24, 28):  # finished, in progress and two future bookings
+                BookingEntry.objects.create(
+                    user=regular_user,
+                    equipment=equipment,
+                    slot=(now + timedelta(hours=offset), now + timedelta(hours=offset + 3)),
+                    charge=0.0,
+                )
+        booking = BookingEntry(user=regular_user, equipment=equipment)
+        with django_assert_num_queries(1):
+            assert booking.get_booked_time(now) == timedelta(hours=9)
+            assert booking.get_booked_time(now) == timedelta(hours=9)
+
+    @pytest.mark.parametrize(
+        "first,second,expected",
+        [
+            ((9, 12), (12, 15), False),
+            ((9, 12), (11, 15), True),
+            ((9, 12), (10, 11), True),
+            ((12, 15), (9, 12), False),
+            ((9, None), (20, 21), True),
+        ],
+    )
+    def test_slots_overlap(self, first, second, expected):
+        """Verify that slots_overlap treats slots as half-open ranges with optional bounds."""
+        # external imports
+        from bookings.models import slots_overlap
+
+        def slot(lower, upper):
+            return SimpleNamespace(
+                lower=datetime(2024, 1, 2, lower),
+                upper=None if upper is None else datetime(2024, 1, 2, upper),
+            )
+
+        assert slots_overlap(slot(*first), slot(*second)) is expected
+
+    @pytest.mark.django_db
+    def test_bulk_clean_reports_overlaps(self, django_assert_num_queries, equipment, regular_user):
+        """Verify that bulk_clean finds overlaps with saved and batched bookings in one query after prefetching."""
+        # Django imports
+        from django.core.exceptions import ValidationError
+
+        # external imports
+        from bookings.models import BookingEntry
+        from psycopg2.extras import DateTimeTZRange
+
+        def booking(start, end):
+            return BookingEntry(
+                user=regular_user,
+                equipment=equipment,
+                slot=DateTimeTZRange(datetime(2024, 1, 2, start), datetime(2024, 1, 2, end)),
+                charge=0.0,
+            )
+
+        with patch.object(BookingEntry, "clean"), patch.object(BookingEntry, "calculate_charge", return_value=0.0):
+            booking(9, 12).save()
+            entries = [booking(12, 15), booking(15, 18), booking(16, 17), booking(10, 11)]
+            # Equipment lock, policies, userlist, shifts, booked time and the overlap check
+            with django_assert_num_queries(6) as captured, pytest.raises(ValidationError) as err:
+                BookingEntry.bulk_clean(entries)
+        assert len(err.value.error_list) == 2
+        assert "FOR UPDATE" in captured.captured_queries[0]["sql"]
+
+    @pytest.mark.django_db
+    def test_bulk_clean_counts_the_batch_towards_quotas(self, django_assert_num_queries, equipment, regular_user):
+        """Verify that bulk_clean sums booked time once and counts earlier bookings in the batch against quotas."""
+        # Django imports
+        from django.utils import timezone
+
+        # external imports
+        from bookings.models import BookingEntry
+        from psycopg2.extras import DateTimeTZRange
+
+        start = timezone.now().replace(microsecond=0) + timedelta(days=7)
+        entries = [
+            BookingEntry(
+                user=regular_user,
+                booker=regular_user,
+                equipment=equipment,
+                slot=DateTimeTZRange(start + timedelta(hours=hour), start + timedelta(hours=hour + 3)),
+                charge=0.0,
+            )
+            for hour in (0, 3, 6)
+        ]
+        booked = []
+
+        def clean(self, no_holds=False, check_conflicts=True):
+            booked.append(self.get_booked_time())
+
+        with patch.object(BookingEntry, "clean", clean), django_assert_num_queries(6):
+            BookingEntry.bulk_clean(entries)
+        assert booked == [timedelta(0), timedelta(hours=3), timedelta(hours=6)]
+        assert "_batch_booked" not in entries[0].__dict__
+        assert "userlist" in entries[0].equipment._prefetched_objects_cache
+
+    def test_rationalise_keeps_an_already_fixed_slot(self):
+        """rationalise only replaces the slot when the policy moves its bounds."""
+        # external imports
+        from bookings.models import BookingEntry
+        from psycopg2.extras import DateTimeTZRange
+
+        start, end = datetime(2024, 1, 2, 9), datetime(2024, 1, 2, 12)
+        slot = DateTimeTZRange(start, end)
+        booking = BookingEntry(slot=slot)
+        policy = Mock()
+        policy.fix_times.return_value = (start, end)
+        assert booking.rationalise(policy).slot is slot
+        policy.fix_times.return_value = (start, end + timedelta(hours=3))
+        assert booking.rationalise(policy).slot == DateTimeTZRange(start, end + timedelta(hours=3))
+
+    @pytest.mark.django_db
+    def test_save_locks_equipment_while_cleaning(self, django_assert_max_num_queries, equipment, regular_user):
+        """Verify that a cleaned save locks the equipment row, and a pre-cleaned save does not."""
+        # external imports
+        from bookings.models import BookingEntry
+
+        booking = BookingEntry(
+            user=regular_user,
+            equipment=equipment,
+            slot=(datetime(2024, 1, 2, 9, 0), datetime(2024, 1, 2, 12, 0)),
+            charge=0.0,
+        )
+        with patch.object(BookingEntry, "clean"), patch.object(BookingEntry, "calculate_charge", return_value=0.0):
+            with django_assert_max_num_queries(10) as captured:
+                booking.save()
+            assert any("FOR UPDATE" in query["sql"] for query in captured.captured_queries)
+            with django_assert_max_num_queries(10) as captured:
+                booking.save(force_clean=None)
+            assert not any("FOR UPDATE" in query["sql"] for query in captured.captured_queries)
+
+    @pytest.mark.django_db
+    def test_fix_project_checks_membership_in_one_query(
+        self, django_assert_num_queries, regular_user, cost_centre, cost_rate
+    ):
+        """fix_project fills in the default project or checks the chosen one with a single query."""
+        # external imports
+        from bookings.models import BookingEntry
+        from costings.models import CostCentre
+
+        regular_user.project.add(cost_centre)
+        other = CostCentre.objects.create(name="Other", short_name="OP", account_code="ACC002", rate=cost_rate)
+        booking = BookingEntry(user=regular_user)
+        with django_assert_num_queries(1):
+            assert booking.fix_project() is None
+        assert booking.cost_centre == cost_centre
+        with django_assert_num_queries(1):
+            assert BookingEntry(user=regular_user, cost_centre=cost_centre).fix_project() is None
+        assert BookingEntry(user=regular_user, cost_centre=other).fix_project() == cost_centre
+
+    @pytest.mark.django_db
+    def test_count_shifts_over_several_days(self, equipment, shift):
+        """count_shifts counts every turn of the shift cycle covered by a long booking."""
+        # external imports
+        from bookings.models import BookingEntry
+        from labman_utils.models import ensure_tz
+        from psycopg2.extras import DateTimeTZRange
+
+        equipment.shifts.add(shift)
+        start, end = ensure_tz(datetime(2024, 1, 2, 9)), ensure_tz(datetime(2024, 1, 4, 17))
+        booking = BookingEntry(equipment=equipment, slot=DateTimeTZRange(start, end))
+        policy = Mock()
+        policy.fix_times.return_value = (start, end)
+        assert booking.count_shifts(policy) == 7
+        policy.fix_times.return_value = (start, start + timedelta(hours=8))
+        assert booking.count_shifts(policy) == 1
+
+    @pytest.mark.django_db
+    def test_membership_missing_user(self, equipment, regular_user):
+        """Verify that a user not on the userlist has no role and is held."""
+        # external imports
+        from bookings.models import BookingEntry
+
+        booking = BookingEntry(user=regular_user, equipment=equipment)
+        assert booking.user_role is None
+        assert booking.user_hold
+        assert booking.admin_hold
+
 
 class TestBookingExceptions:
     """Tests for the booking exception class hierarchy."""
@@ -124,6 +479,219 @@ class TestBookingExceptions:
         assert isinstance(err, BookingError)
 
 
+class TestBookingEntryFilterForm:
+    """Tests for the booking report filter form."""
+
+    def test_order_choices_use_report_field_names(self):
+        """Verify that every report order choice names only the columns the report groups by."""
+        # external imports
+        from bookings.forms import REPORT_ORDER_CHOICES
+
+        report_fields = {"user", "user_group", "equipment", "cost_centre"}
+        for value, _ in REPORT_ORDER_CHOICES:
+            assert set(value.split(",")) <= report_fields, value
+
+
+class TestCustomSlotWidget:
+    """Tests for the booking slot range widget."""
+
+    def test_decompress_empty_returns_shared_constant(self):
+        """Verify that an empty slot decompresses to the shared EMPTY_SLOT tuple."""
+        # external imports
+        from bookings.forms import EMPTY_SLOT, CustomSlotWidget
+
+        widget = CustomSlotWidget()
+        assert widget.decompress(None) is EMPTY_SLOT
+        assert CustomSlotWidget().decompress(None) is EMPTY_SLOT
+
+    def test_decompress_splits_bounds(self):
+        """Verify that a slot decompresses into date and time pairs."""
+        # external imports
+        from bookings.forms import CustomSlotWidget
+
+        start = datetime(2024, 1, 2, 9, 0)
+        end = datetime(2024, 1, 2, 12, 0)
+        value = SimpleNamespace(lower=start, upper=end)
+        assert CustomSlotWidget().decompress(value) == (
+            [start.date(), start.time()],
+            [end.date(), end.time()],
+        )
+
+
+class TestBookingEntryAdminForm:
+    """Tests for the booking admin form."""
+
+    def test_fields_cover_every_editable_model_field(self):
+        """Verify that the explicit field list matches the editable BookingEntry fields."""
+        # external imports
+        from bookings.forms import BookingEntryAdminForm
+        from bookings.models import BookingEntry
+
+        editable = [
+            field.name
+            for field in BookingEntry._meta.get_fields()
+            if getattr(field, "editable", False) and not field.auto_created and field.concrete
+        ]
+        assert sorted(BookingEntryAdminForm.base_fields) == sorted(editable)
+
+
+class TestBookingEntryAdmin:
+    """Tests for the booking entry ModelAdmin."""
+
+    @pytest.mark.django_db
+    def test_get_form_reuses_class_for_same_permissions(self, rf, superuser, regular_user):
+        """Verify that the generated admin form class is cached per permission set."""
+        # Django imports
+        from django.contrib.admin import site
+
+        # external imports
+        from bookings.models import BookingEntry
+
+        admin = site._registry[BookingEntry]
+        admin._form_cache.clear()
+        request = rf.get("/")
+        request.user = superuser
+        form = admin.get_form(request, fields=None)
+        assert admin.get_form(request, fields=None) is form
+        request.user = regular_user
+        assert admin.get_form(request, fields=None) is not form
+
+
+class TestBookingEntryResource:
+    """Tests for the booking entry import-export resource."""
+
+    @pytest.mark.django_db
+    def test_lookup_widget_reads_table_once(self, cost_centre, django_assert_num_queries):
+        """Verify that the lookup widget resolves repeated values from a single query."""
+        # external imports
+        from bookings.resource import LookupForeignKeyWidget
+        from costings.models import CostCentre
+
+        widget = LookupForeignKeyWidget(CostCentre, "short_name")
+        with django_assert_num_queries(1):
+            assert widget.clean("TP") == cost_centre
+            assert widget.clean("TP") == cost_centre
+        assert widget.clean("") is None
+
+    @staticmethod
+    def _dataset(equipment, booker, *hours):
+        """Build an import dataset of one booking of equipment by booker starting at each of hours on 2 Jan 2024."""
+        # external imports
+        import tablib
+        from labman_utils.models import DEFAULT_TZ
+        from psycopg2.extras import DateTimeTZRange
+
+        dataset = tablib.Dataset(headers=["user", "booker", "equipment", "slot"])
+        for hour in hours:
+            slot = DateTimeTZRange(
+                datetime(2024, 1, 2, hour, tzinfo=DEFAULT_TZ), datetime(2024, 1, 2, hour + 3, tzinfo=DEFAULT_TZ)
+            )
+            dataset.append(["testuser", booker.pk, equipment.name, slot])
+        return dataset
+
+    @pytest.mark.django_db
+    def test_import_cleans_bookings_as_a_batch(self, equipment, regular_user):
+        """Verify that an import checks all its bookings with one bulk_clean call before saving them."""
+        # external imports
+        from bookings.models import BookingEntry
+        from bookings.resource import BookingEntryResource
+
+        with (
+            patch.object(BookingEntry, "clean") as clean,
+            patch.object(BookingEntry, "calculate_charge", return_value=0.0),
+            patch.object(BookingEntry, "bulk_clean", wraps=BookingEntry.bulk_clean) as bulk_clean,
+        ):
+            result = BookingEntryResource().import_data(self._dataset(equipment, regular_user, 9, 12, 15))
+        assert not result.has_errors()
+        bulk_clean.assert_called_once()
+        assert clean.call_count == 3  # Once per booking by bulk_clean, not again by save()
+        assert BookingEntry.objects.filter(equipment=equipment).count() == 3
+
+    @pytest.mark.django_db
+    def test_import_saves_nothing_if_bookings_overlap(self, equipment, regular_user):
+        """Verify that an import whose bookings overlap each other reports an error and saves none of them."""
+        # external imports
+        from bookings.models import BookingEntry
+        from bookings.resource import BookingEntryResource
+
+        with patch.object(BookingEntry, "clean"), patch.object(BookingEntry, "calculate_charge", return_value=0.0):
+            result = BookingEntryResource().import_data(self._dataset(equipment, regular_user, 9, 10))
+        assert result.has_errors()
+        assert not BookingEntry.objects.filter(equipment=equipment).exists()
+
+    @pytest.mark.django_db
+    def test_import_queries_do_not_grow_with_rows(
+        self, django_assert_max_num_queries, equipment, regular_user, role_trainee, shift
+    ):
+        """Verify that importing more bookings only adds their inserts, not more lookups per row."""
+        # external imports
+        from bookings.models import BookingEntry
+        from bookings.resource import BookingEntryResource
+        from equipment.models import UserListEntry
+
+        equipment.shifts.add(shift)
+        UserListEntry.objects.create(equipment=equipment, user=regular_user, role=role_trainee)
+
+        def clean(self, no_holds=False, check_conflicts=True):
+            # Read the equipment policies, userlist and shifts as the real clean() does
+            list(self.equipment.policies.all())
+            assert self.user_role == self.booker_role == role_trainee
+            list(self.equipment.shifts.all())
+
+        def lookups(captured):
+            """Return the queries other than each row's insert and the savepoint around it."""
+            return [
+                query["sql"]
+                for query in captured.captured_queries
+                if not query["sql"].startswith(("INSERT", "SAVEPOINT", "RELEASE SAVEPOINT"))
+            ]
+
+        with (
+            patch.object(BookingEntry, "clean", clean),
+            patch.object(BookingEntry, "calculate_charge", return_value=0.0),
+        ):
+            one_row = self._dataset(equipment, regular_user, 18)
+            with django_assert_max_num_queries(40) as one:
+                assert not BookingEntryResource().import_data(one_row).has_errors()
+            many_rows = self._dataset(equipment, regular_user, 0, 3, 6, 9, 12)
+            with django_assert_max_num_queries(40) as many:
+                assert not BookingEntryResource().import_data(many_rows).has_errors()
+        assert len(lookups(many)) == len(lookups(one))
+        assert BookingEntry.objects.count() == 6
+
+    @pytest.mark.django_db
+    def test_booker_round_trips_as_primary_key(self, equipment, regular_user):
+        """Verify that bookers are still exported as, and imported from, their primary keys."""
+        # external imports
+        from bookings.models import BookingEntry
+        from bookings.resource import BookingEntryResource
+
+        with (
+            patch.object(BookingEntry, "clean"),
+            patch.object(BookingEntry, "calculate_charge", return_value=0.0),
+        ):
+            assert not BookingEntryResource().import_data(self._dataset(equipment, regular_user, 9)).has_errors()
+        exported = BookingEntryResource().export(queryset=BookingEntry.objects.all())
+        assert exported["booker"] == [regular_user.pk]
+        assert BookingEntry.objects.get().booker == regular_user
+
+    @pytest.mark.django_db
+    def test_import_sets_cost_centre(self, cost_centre, equipment, regular_user):
+        """Verify that the cost_centre column sets the imported booking's cost centre."""
+        # external imports
+        from bookings.models import BookingEntry
+        from bookings.resource import BookingEntryResource
+
+        dataset = self._dataset(equipment, regular_user, 9)
+        dataset.append_col([cost_centre.short_name], header="cost_centre")
+        with (
+            patch.object(BookingEntry, "clean"),
+            patch.object(BookingEntry, "calculate_charge", return_value=0.0),
+        ):
+            assert not BookingEntryResource().import_data(dataset).has_errors()
+        assert BookingEntry.objects.get().cost_centre == cost_centre
+
+
 class TestBookingViews:
     """Integration tests for bookings app views."""
 
@@ -185,7 +753,7 @@ class TestBookingViews:
         equipment.shifts.add(shift)
         url = reverse("bookings:equipment_calendar_cat", kwargs={"cat": equipment.category})
 
-        with patch("bookings.views.CalTable.fill_entries", autospec=True, return_value=[]) as fill_entries:
+        with patch("equipment.tables.CalTable.fill_entries", autospec=True, return_value=[]) as fill_entries:
             response = client_logged_in.get(url)
 
         assert response.status_code == 200
@@ -207,6 +775,52 @@ class TestBookingViews:
         response = client_logged_in.get(url)
         assert response.status_code == 200
 
+    @pytest.mark.django_db
+    def test_booking_records_view_builds_report_once_per_request(self, client_logged_in):
+        """The report is built once per request, although the html page builds its context twice."""
+        # external imports
+        from bookings.views import BookingRecordsView
+
+        url = reverse("bookings:reporting")
+        data = {"from_date": "2024-01-01", "to_date": "2024-01-31", "order": "user,equipment", "output": "html"}
+        build_report = BookingRecordsView.build_report
+        with patch.object(BookingRecordsView, "build_report", autospec=True, side_effect=build_report) as built:
+            client_logged_in.post(url, data)
+            assert built.call_count == 1
+            client_logged_in.post(url, {**data, "output": "csv"})
+            assert built.call_count == 2  # Reports are not shared between requests
+
+    @pytest.mark.django_db
+    def test_booking_dialog_looks_up_booking_once(self, rf, django_assert_num_queries, equipment, regular_user):
+        """Verify that the dialog reuses one booking lookup, and its equipment, for the object and initial data."""
+        # Django imports
+        from django.utils import timezone
+
+        # external imports
+        from bookings.models import BookingEntry
+        from bookings.views import BookingDialog
+
+        with patch.object(BookingEntry, "clean"), patch.object(BookingEntry, "calculate_charge", return_value=0.0):
+            booking = BookingEntry.objects.create(
+                user=regular_user,
+                booker=regular_user,
+                equipment=equipment,
+                slot=(datetime(2024, 1, 2, 9, 0), datetime(2024, 1, 2, 12, 0)),
+                charge=0.0,
+            )
+        view = BookingDialog()
+        view.setup(rf.get("/"), equipment=equipment.pk, ts=timezone.make_aware(datetime(2024, 1, 2, 10)).timestamp())
+        with django_assert_num_queries(1):
+            assert view.get_object() == booking
+            assert view.get_initial()["equipment"] == equipment
+            assert view.get_object().user == regular_user
+
+    @pytest.mark.parametrize("ts", [5, 5.5, 1704186000, 1704186000.25])
+    def test_booking_dialog_url_accepts_any_timestamp(self, ts):
+        """Verify that the booking dialog url round trips single digit and whole number timestamps."""
+        match = resolve(reverse("bookings:equipment_booking", kwargs={"equipment": 3, "ts": ts}))
+        assert match.kwargs == {"equipment": 3, "ts": float(ts)}
+
     def test_rejected_booking_delete_returns_not_modified(self):
         """A policy-rejected booking deletion is not reported as successful."""
         # external imports
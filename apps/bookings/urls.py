@@ -23,7 +23,7 @@ class FloatUrlParameterConverter:
 
     """
 
-    regex = r"[0-9]+\.?[0-9]+"
+    regex = r"[0-9]+(?:\.[0-9]+)?"
 
     def to_python(self, value):
         """Convert string to floating point value.
@@ -11,36 +11,37 @@ import json
 import operator
 from datetime import datetime as dt, time as Time, timedelta as td
 from functools import reduce
+from zoneinfo import ZoneInfo
 
 # Django imports
 from django import views
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
-from django.db.models import Count, Q
+from django.db.models import Q
 from django.http import (
     HttpResponse,
     HttpResponseNotFound,
     HttpResponseNotModified,
 )
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 
 # external imports
 import numpy as np
 import pandas as pd
-import pytz
 from accounts.models import Account
 from costings.models import CostCentre
 from easy_pdf.rendering import render_to_pdf_response
 from equipment.models import Equipment
-from equipment.tables import CalTable
+from equipment.tables import category_calendar
 from htmx_views.views import HTMXFormMixin
 from labman_utils.views import FormListView, IsAuthenticaedViewMixin
 
 # app imports
 from . import forms, models
 
-DEFAULT_TZ = pytz.timezone(settings.TIME_ZONE)
+DEFAULT_TZ = ZoneInfo(settings.TIME_ZONE)
 
 # Constants for handling missing/orphaned foreign key references
 UNKNOWN_EQUIPMENT = "[Unknown Equipment]"
@@ -248,26 +249,9 @@ class CategoryCalendarView(IsAuthenticaedViewMixin, views.generic.TemplateView):
         # Build the calendar rows from the shifts.
         date = self.kwargs.get("date", int(self.request.GET.get("date", dt.today().strftime("%Y%m%d"))))
         cat = self.kwargs.get("cat", self.request.GET.get("cat", ""))
-        equip_vec = (
-            Equipment.objects.filter(category=cat)
-            .annotate(policy_count=Count("policies"))
-            .filter(policy_count__gt=0, offline=False)
-            .prefetch_related("shifts")
-            .order_by("name")
-        )
-        equipment = Equipment.objects.filter(category=cat).first()
-        if equip_vec.count() == 0:
+        table, _ = category_calendar(cat, self.kwargs.get("date", date), self.request)
+        if table is None:
             return context
-        table = CalTable(
-            date=self.kwargs.get("date", date),
-            request=self.request,
-            equipment=equipment,
-            equip_vec=equip_vec,
-            table_contents="&nbsp;",
-        )
-        table.classes += " table-bordered"
-        for equipment in equip_vec:
-            table.fill_entries(equipment)
         context["cal"] = table
         return context
 
@@ -320,15 +304,43 @@ class BookingDialog(IsAuthenticaedViewMixin, HTMXFormMixin, views.generic.Update
         context = super().get_context_data(**kwargs)
         context["current_url"] = self.request.htmx.current_url
         context["ts"] = self.kwargs.get("ts", None)
-        context["equipment"] = Equipment.objects.get(pk=self.kwargs.get("equipment", None))
+        context["equipment"] = self._equipment
         context["equipment_id"] = self.kwargs.get("equipment", None)
         context["edit"] = self.get_object() is not None
         return context
 
+    @cached_property
+    def _start(self):
+        """Convert the requested timestamp to a datetime once per request."""
+        return dt.fromtimestamp(self.kwargs.get("ts"), DEFAULT_TZ)
+
+    @cached_property
+    def _booking(self):
+        """Look up the booking at the requested time once per request."""
+        equipment = self.kwargs.get("equipment")
+        start = self._start
+        end = start + td(seconds=1)
+        slot = DateTimeTZRange(lower=start, upper=end)
+        try:
+            return models.BookingEntry.objects.select_related("equipment", "user", "booker", "cost_centre").get(
+                equipment__pk=equipment, slot__overlap=slot
+            )
+        except ObjectDoesNotExist:
+            return None
+
+    @cached_property
+    def _equipment(self):
+        """Return the equipment being booked, reusing the booking's copy when there is one."""
+        if (booking := self._booking) is not None:
+            return booking.equipment
+        return Equipment.objects.get(pk=self.kwargs.get("equipment"))
+
     def get_object(self, queryset=None):
         """Get the BookingEntry for the specified equipment and time slot.
 
                         Searches for an existing booking that overlaps with the specified timestamp.
+                        The dialog asks for the object several times while handling one request,
+                        so the lookup is only made once.
 
         Keyword Parameters:
             queryset (QuerySet or None): Optional queryset to use for lookup.
@@ -348,17 +360,7 @@ class BookingDialog(IsAuthenticaedViewMixin, HTMXFormMixin, views.generic.Update
                 True
 
         """
-        equipment = self.kwargs.get("equipment")
-        start = dt.fromtimestamp(self.kwargs.get("ts"), DEFAULT_TZ)
-        end = start + td(seconds=1)
-        slot = DateTimeTZRange(lower=start, upper=end)
-        try:
-            ret = models.BookingEntry.objects.select_related("equipment").get(
-                equipment__pk=equipment, slot__overlap=slot
-            )
-            return ret
-        except ObjectDoesNotExist:
-            return None
+        return self._booking
 
     def get_initial(self):
         """Make initial entry.
@@ -387,8 +389,8 @@ class BookingDialog(IsAuthenticaedViewMixin, HTMXFormMixin, views.generic.Update
                 "booker": this.booker,
                 "cost_centre": this.cost_centre,
             }
-        equipment = Equipment.objects.get(pk=self.kwargs.get("equipment"))
-        start = dt.fromtimestamp(self.kwargs.get("ts"), DEFAULT_TZ)
+        equipment = self._equipment
+        start = self._start
         if shift := equipment.get_shift(start):
             start = dt.combine(start.date(), shift.start_time)
             end = start + shift.duration
@@ -590,8 +592,8 @@ class BookingRecordsView(IsAuthenticaedViewMixin, FormListView):
         data = self.form.cleaned_data
         qs = super().get_queryset()
 
-        start = DEFAULT_TZ.localize(dt.combine(data["from_date"], dt.min.time()))
-        end = DEFAULT_TZ.localize(dt.combine(data["to_date"], dt.max.time()))
+        start = dt.combine(data["from_date"], dt.min.time(), tzinfo=DEFAULT_TZ)
+        end = dt.combine(data["to_date"], dt.max.time(), tzinfo=DEFAULT_TZ)
         qs = qs.filter(slot__overlap=DateTimeTZRange(start, end))
 
         if data["equipment"]:
@@ -641,11 +643,35 @@ class BookingRecordsView(IsAuthenticaedViewMixin, FormListView):
 
         """
         context = super().get_context_data(**kwargs)
-        entries = context["entries"]
+        # The html page builds its context twice in one request, so keep the report for the second time round
+        if (report := getattr(self, "_report", None)) is None:
+            report = self._report = self.build_report(context["entries"])
+        self.data, self.df, html = report
+        if html is not None:
+            context["data"] = html
+        return context
+
+    def build_report(self, entries):
+        """Build the report tables for the filtered booking entries.
+
+        Args:
+            entries (QuerySet): The filtered booking entries.
+
+        Returns:
+            (tuple): The (sub-totalled data, raw records, html table) for the report. For an empty report the
+            first two are the empty DataFrame and the html table is None.
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> callable(BookingRecordsView.build_report)
+                True
+
+        """
         df = pd.DataFrame(entries.values("user", "cost_centre", "equipment", "shifts", "slot", "charge", "comment"))
         if len(df) == 0:
-            self.df = df
-            return context
+            return df, df, None
         # Bulk load all related objects to avoid N+1 queries
         equipment_ids = df["equipment"].unique()
         user_ids = df["user"].unique()
@@ -678,7 +704,7 @@ class BookingRecordsView(IsAuthenticaedViewMixin, FormListView):
         data = getattr(self.form, "cleaned_data", {})
         groupby = [
             x.title()
-            for x in getattr(self.form, "cleaned_data", {}).get("order", "user,equipment,cost_Centre").split(",")
+            for x in getattr(self.form, "cleaned_data", {}).get("order", "user,equipment,cost_centre").split(",")
         ]
         if getattr(self.form, "cleaned_data", {}).get("reverse", False):
             groupby.reverse()
@@ -704,5 +730,4 @@ class BookingRecordsView(IsAuthenticaedViewMixin, FormListView):
                 ["User", "User_Group", "Cost_Centre", "Equipment", "Start", "End", "Shifts", "Charge", "Comment"]
             ]
         self.df = df[["User", "User_Group", "Cost_Centre", "Equipment", "Start", "End", "Shifts", "Charge", "Comment"]]
-        context["data"] = self.data.to_html(classes="table table-striped table-hover tabel-responsive")
-        return context
+        return self.data, self.df, self.data.to_html(classes="table table-striped table-hover tabel-responsive")
@@ -21,3 +21,4 @@ class CostCentreAutocomplete(ModelAutocomplete):
 
     model = CostCentre
     search_attrs = ["name", "short_name", "account_code", "description"]
+    search_cache_timeout = 30
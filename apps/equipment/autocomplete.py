@@ -27,6 +27,8 @@ class EquipmentAutocomplete(ModelAutocomplete):
     """
 
     model = Equipment
+    label_select_fields = ("name",)
+    search_cache_timeout = 30
 
     @classmethod
     def get_query_filtered_queryset(cls, search, context):
@@ -86,6 +88,7 @@ class LocationAutocomplete(ModelAutocomplete):
     """
 
     model = Location
+    search_cache_timeout = 30
 
     @classmethod
     def get_query_filtered_queryset(cls, search, context):
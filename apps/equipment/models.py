@@ -27,6 +27,7 @@ from django.apps import apps
 from django.contrib.flatpages.models import FlatPage
 from django.contrib.postgres.fields import DateRangeField
 from django.db import models
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 
 # external imports
@@ -378,6 +379,56 @@ class Equipment(ResourceedObject):
 
         return f"/bookings/cal/{self.id}/{date}/"
 
+    @cached_property
+    def shift_list(self):
+        """Return the equipment's shifts in order, loading them once per instance.
+
+        Returns:
+            (list of Shift):
+                The shifts for this equipment (empty if none are defined).
+
+        Notes:
+            get_shift() is called for both ends of every booking being checked, so the shifts are cached here rather
+            than queried again for each call. A prefetched ``shifts`` relation is used if present.
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> type(Equipment.shift_list).__name__
+                'cached_property'
+
+        """
+        return list(self.shifts.all())
+
+    @cached_property
+    def shift_cycle(self):
+        """Return the durations and weightings of the equipment's shifts, with a lookup of each shift's position.
+
+        Returns:
+            (tuple):
+                A tuple of ``(durations, weightings, positions)`` where durations and weightings are tuples in shift
+                order and positions maps each shift's primary key to its index.
+
+        Notes:
+            BookingEntry.count_shifts() walks round the shift cycle for every booking it charges, so the shift
+            durations (which are computed rather than stored) and positions are worked out once per instance.
+
+
+        Examples:
+            Inspect the public interface in an interactive session::
+
+                >>> type(Equipment.shift_cycle).__name__
+                'cached_property'
+
+        """
+        shifts = self.shift_list
+        return (
+            tuple(shift.duration for shift in shifts),
+            tuple(shift.weighting for shift in shifts),
+            {shift.pk: ix for ix, shift in enumerate(shifts)},
+        )
+
     @property
     def calendar_time_vector(self):
         """Generate a list of shift start times for calendar construction.
@@ -394,13 +445,9 @@ class Equipment(ResourceedObject):
                 True
 
         """
-        if self.shifts.all().count() == 0:
+        if not (shifts := self.shift_list):
             return None
-        # Got some shifts
-        ret = []
-        for shift in self.shifts.all():
-            ret.append(shift.start_time)
-        return ret
+        return [shift.start_time for shift in shifts]
 
     @property
     def userlist_dict(self):
@@ -528,17 +575,17 @@ class Equipment(ResourceedObject):
                 True
 
         """
-        if self.shifts.all().count() == 0:
+        if not (shifts := self.shift_list):
             return None
         if isinstance(time, dt):
             time = time.time()
         elif not isinstance(time, Time):
             raise TypeError("Was expecting to get either a datetime or time object.")
-        if delta_t(time, self.shifts.first().start_time).total_seconds() < 0:  # Booking from previous day
+        if delta_t(time, shifts[0].start_time).total_seconds() < 0:  # Booking from previous day
             time = dt.combine(dt.today(), time) + td(days=1)
         else:
             time = dt.combine(dt.today(), time)
-        for shift in self.shifts.all():
+        for shift in shifts:
             s = dt.combine(dt.today(), shift.start_time)
             e = dt.combine(dt.today(), shift.end_time)
             if (e - s).total_seconds() <= 0:
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Table classes for LabMAN."""
 # Python imports
+from bisect import bisect_left, bisect_right
 from datetime import (
     date as Date,
     datetime as dt,
@@ -11,25 +12,61 @@ from typing import List, Tuple, Union
 
 # Django imports
 from django.conf import settings
+from django.db.models import Count, Prefetch, prefetch_related_objects
 from django.utils.html import format_html
 
 # external imports
-import numpy as np
 import pytz
 from constance import config
 from psycopg2.extras import DateTimeTZRange
 from simple_html_table import Table
 
+# app imports
+from .models import Equipment, UserListEntry
+
 DEFAULT_TZ = pytz.timezone(settings.TIME_ZONE)
 
 
-def calendar_date_vector(date: Union[Date, dt]) -> List[Date]:
+def calendar_start_day(request=None) -> int:
+    """Return the configured first day of the calendar week, reading it at most once per request.
+
+    Keyword Parameters:
+        request (HttpRequest):
+            The current request, if any, on which to remember the value.
+
+    Returns:
+        (int):
+            The CALENDAR_START_DAY setting as a weekday number (Monday is 0).
+
+    Notes:
+        Each read of a constance setting is a query against its database backend, and a page of calendars builds
+        a date vector for every table it shows.
+
+    Examples:
+        Inspect the public interface in an interactive session::
+
+            >>> callable(calendar_start_day)
+            True
+
+    """
+    if request is None:
+        return int(config.CALENDAR_START_DAY)
+    if not hasattr(request, "_calendar_start_day"):
+        request._calendar_start_day = int(config.CALENDAR_START_DAY)
+    return request._calendar_start_day
+
+
+def calendar_date_vector(date: Union[Date, dt], start_day: int = None) -> List[Date]:
     """Get the dates for a weekly calendar that includes date.
 
     Args:
         date (Union[Date, dt]):
             Value supplied for ``date``.
 
+    Keyword Parameters:
+        start_day (int):
+            The first day of the week (Monday is 0), defaults to the CALENDAR_START_DAY setting.
+
     Returns:
         (List[Date]):
             The result of the operation.
@@ -41,7 +78,8 @@ def calendar_date_vector(date: Union[Date, dt]) -> List[Date]:
             True
 
     """
-    start_day = int(config.CALENDAR_START_DAY)
+    if start_day is None:
+        start_day = calendar_start_day()
     if isinstance(date, Date):
         date = dt.combine(date, Time(), tzinfo=DEFAULT_TZ)
     dow = date.weekday()
@@ -95,8 +133,41 @@ def yyyymmdd_to_date(value: int) -> Date:
     return DEFAULT_TZ.localize(dt.strptime(value, "%Y%m%d")).date()
 
 
+def calendar_grid(date_vec: List[Date], time_vec: List[Time]) -> Tuple[List[float], List[int]]:
+    """Return the timestamps of a calendar's cells in ascending order, with the index of each cell.
+
+    Args:
+        date_vec (List[Date]):
+            The dates of the calendar columns.
+        time_vec (List[Time]):
+            The times of the calendar rows.
+
+    Returns:
+        (Tuple[List[float], List[int]]):
+            The sorted cell timestamps and, in the same order, each cell's index (date index * len(time_vec) +
+            time index). Equal timestamps are ordered by index.
+
+    Examples:
+        Inspect the public interface in an interactive session::
+
+            >>> callable(calendar_grid)
+            True
+
+    """
+    cells = sorted(
+        (dt.combine(date, time).timestamp(), idt * len(time_vec) + itt)
+        for idt, date in enumerate(date_vec)
+        for itt, time in enumerate(time_vec)
+    )
+    return [stamp for stamp, _ in cells], [ix for _, ix in cells]
+
+
 def datetime_to_coord(
-    target: dt, date_vec: List[Date], time_vec: List[Time], mode: str = "nearest"
+    target: dt,
+    date_vec: List[Date],
+    time_vec: List[Time],
+    mode: str = "nearest",
+    grid: Tuple[List[float], List[int]] = None,
 ) -> Tuple[int, int]:
     """Workout a target datetime's position in time_vec,date_vec.
 
@@ -111,11 +182,17 @@ def datetime_to_coord(
     Keyword Parameters:
         mode (str):
             Value supplied for ``mode``.
+        grid (Tuple[List[float], List[int]]):
+            The result of calendar_grid(date_vec, time_vec), if already worked out for these vectors.
 
     Returns:
         (Tuple[int, int]):
             The result of the operation.
 
+    Notes:
+        The cells are searched by bisecting their sorted timestamps, so callers placing many datetimes in the same
+        calendar should pass the same grid each time.
+
     Examples:
         Inspect the public interface in an interactive session::
 
@@ -123,28 +200,27 @@ def datetime_to_coord(
             True
 
     """
-    data = np.zeros(len(date_vec) * len(time_vec))
-    for idt, date in enumerate(date_vec):
-        for itt, time in enumerate(time_vec):
-            data[idt * len(time_vec) + itt] = dt.combine(date, time).timestamp()
+    stamps, cells = grid or calendar_grid(date_vec, time_vec)
     target = target.timestamp()
-    delta = data - target
     match mode:
         case "start":  # Looking for a ts that is == or < target
-            delta[delta > 0] = np.nan
-            try:
-                ix = np.nanargmax(delta)
-            except ValueError:
+            if pos := bisect_right(stamps, target):
+                ix = cells[bisect_left(stamps, stamps[pos - 1])]
+            else:
                 ix = 0
         case "end":  # looking for a ts that is == to > target and then back of 1 on the ix
-            delta[delta < 0] = np.nan
-            try:
-                ix = np.nanargmin(delta) - 1
-            except ValueError:
-                ix = len(delta) - 1
+            if (pos := bisect_left(stamps, target)) < len(stamps):
+                ix = cells[pos] - 1
+            else:
+                ix = len(stamps) - 1
         case "nearest":  # Looking for the ts that is closest in any direction.
-            delta = np.abs(delta)
-            ix = np.nanargmin(delta)
+            pos = bisect_left(stamps, target)
+            candidates = []
+            if pos < len(stamps):
+                candidates.append((stamps[pos] - target, cells[pos]))
+            if pos > 0:
+                candidates.append((target - stamps[pos - 1], cells[bisect_left(stamps, stamps[pos - 1])]))
+            ix = min(candidates)[1]
         case _:
             raise ValueError(f"Uknown find_coords {mode}")
     col = ix // len(time_vec) + 1
@@ -177,13 +253,19 @@ class CalTable(Table):
 
                 time_vec.extend(t_vec)
             rows += len(time_vec)
-            date_vec = calendar_date_vector(yyyymmdd_to_date(kargs.get("date", dt.today().strftime("%Y%m%d"))))
+            date_vec = calendar_date_vector(
+                yyyymmdd_to_date(kargs.get("date", dt.today().strftime("%Y%m%d"))),
+                calendar_start_day(kargs.get("request")),
+            )
             args = ((rows, 8),)
         elif equipment := kargs.pop("equipment", None):
             time_vec = equipment.calendar_time_vector
             equip_vec = [equipment] * len(time_vec)
             row_label = [1] * len(time_vec)
-            date_vec = calendar_date_vector(yyyymmdd_to_date(kargs.get("date", dt.today().strftime("%Y%m%d"))))
+            date_vec = calendar_date_vector(
+                yyyymmdd_to_date(kargs.get("date", dt.today().strftime("%Y%m%d"))),
+                calendar_start_day(kargs.get("request")),
+            )
             rows = len(time_vec) + 1
             args = ((rows, 8),)
         if len(args) == 0:
@@ -199,7 +281,12 @@ class CalTable(Table):
         self.request = kargs.pop("request", None)
         table_content = kargs.pop("table_contents", "&nbsp;")
         if isinstance(table_content, str):
-            table_content = np.array([[table_content] * (len(self.date_vec) + 1)] * (len(self.time_vec) + 1))
+            # Table wants an array with a shape, or a callable it asks for each cell's content - so no array needed
+            fill = table_content
+
+            def table_content(cell):
+                return fill
+
         kargs["table_contents"] = table_content
         super().__init__(*args, **kargs)
         self.build_table()
@@ -295,31 +382,81 @@ class CalTable(Table):
             dt.combine(date_vec[0], time_vec[0], tzinfo=DEFAULT_TZ),
             dt.combine(date_vec[-1], time_vec[-1], tzinfo=DEFAULT_TZ),
         )
-        entries = equipment.bookings.filter(slot__overlap=target_range)
+        # Every entry shows its user's name and role css - fetch the users with the bookings and the equipment's
+        # userlist once, then share this equipment (and so its userlist) between all the entries.
+        entries = list(equipment.bookings.filter(slot__overlap=target_range).select_related("user"))
+        prefetch_related_objects(
+            [equipment], Prefetch("userlist", queryset=UserListEntry.objects.select_related("role"))
+        )
+        for entry in entries:
+            entry.equipment = equipment
+        grid = calendar_grid(date_vec, time_vec)
+        rows = len(time_vec)
+        top = 1 + row_base
         for entry in entries:
-            row_start, col_start = datetime_to_coord(entry.slot.lower, date_vec, time_vec, mode="start")
-            row_end, col_end = datetime_to_coord(entry.slot.upper, date_vec, time_vec, mode="end")
+            row_start, col_start = datetime_to_coord(entry.slot.lower, date_vec, time_vec, mode="start", grid=grid)
+            row_end, col_end = datetime_to_coord(entry.slot.upper, date_vec, time_vec, mode="end", grid=grid)
             row_start += row_base
             row_end += row_base
             if col_end < 0:  # Finished before first slot
                 continue
             if col_start == col_end:  # single day
-                if max(row_end - row_start + 1, 1) > 1:
-                    self[row_start, col_start].rowspan = max(row_end - row_start + 1, 1)
-                self[row_start, col_start].content = entry.user.display_name
-                self[row_start, col_start].classes += f" {entry.calendar_css}"
-            else:  # spans day boundaries
-                if len(time_vec) - row_start + 1 > 1:
-                    self[row_start, col_start].rowspan = len(time_vec) - row_start + 1
-                self[row_start, col_start].content = entry.user.display_name
-                self[row_start, col_start].classes += f" {entry.calendar_css}"
-                for col in range(col_start + 1, col_end):
-                    if len(time_vec) > 1:
-                        self[1 + row_base, col].rowspan = len(time_vec)
-                    self[1 + row_base, col].content = entry.user.display_name
-                    self[1 + row_base, col].classes += f" {entry.calendar_css}"
-                if max(1, row_end - row_base) > 1:
-                    self[1 + row_base, col_end].rowspan = max(1, row_end - row_base)
-                self[1 + row_base, col_end].content = entry.user.display_name
-                self[1 + row_base, col_end].classes += f" {entry.calendar_css}"
+                spans = [(row_start, col_start, row_end - row_start + 1)]
+            else:  # spans day boundaries - first day, whole days between, then last day
+                spans = [(row_start, col_start, rows - row_start + 1)]
+                spans.extend((top, col, rows) for col in range(col_start + 1, col_end))
+                spans.append((top, col_end, row_end - row_base))
+            # The name and role css are the same for every cell of an entry, so only look them up once
+            name = entry.user.display_name
+            css = f" {entry.calendar_css}"
+            for row, col, span in spans:
+                cell = self[row, col]
+                if span > 1:
+                    cell.rowspan = span
+                cell.content = name
+                cell.classes += css
         return entries
+
+
+def category_calendar(category: str, date: int, request=None) -> Tuple[Union[CalTable, None], List]:
+    """Build and fill a calendar of the bookable equipment in a category.
+
+    Args:
+        category (str):
+            The equipment category to show.
+        date (int):
+            A yyyymmdd datestamp in the week to show.
+
+    Keyword Parameters:
+        request (HttpRequest):
+            The current request.
+
+    Returns:
+        (Tuple[Union[CalTable, None], List]):
+            The filled calendar table and the booking entries shown on it, or (None, []) if the category has no
+            online equipment with booking policies.
+
+    Notes:
+        The equipment is loaded into a list once - with its shifts - so the emptiness test, the table rows and the
+        booking entries all reuse the same query.
+
+    Examples:
+        Inspect the public interface in an interactive session::
+
+            >>> callable(category_calendar)
+            True
+
+    """
+    equip_vec = list(
+        Equipment.objects.filter(category=category)
+        .annotate(policy_count=Count("policies"))
+        .filter(policy_count__gt=0, offline=False)
+        .prefetch_related("shifts")
+        .order_by("name")
+    )
+    if not equip_vec:
+        return None, []
+    table = CalTable(date=date, request=request, equipment=None, equip_vec=equip_vec, table_contents="&nbsp;")
+    table.classes += " table-bordered"
+    entries = [entry for equipment in equip_vec for entry in table.fill_entries(equipment)]
+    return table, entries
@@ -6,7 +6,8 @@ hierarchical location structure, shift duration calculations, and equipment
 properties such as bookability and URL generation, as well as the equipment views.
 """
 # Python imports
-from datetime import time, timedelta
+from datetime import datetime, time, timedelta
+from unittest.mock import PropertyMock, patch
 
 # Django imports
 from django.contrib.auth.models import Group
@@ -163,6 +164,121 @@ class TestEquipment:
         assert "/bookings/cal/" in equipment.schedule
 
 
+    @pytest.mark.django_db
+    def test_get_shift_reuses_loaded_shifts(self, django_assert_num_queries, equipment, shift):
+        """Verify that repeated get_shift calls load the equipment's shifts only once."""
+        equipment.shifts.add(shift)
+        with django_assert_num_queries(1):
+            assert equipment.get_shift(time(10, 0)) == shift
+            assert equipment.get_shift(time(16, 0)) == shift
+            assert equipment.calendar_time_vector == [shift.start_time]
+
+    @pytest.mark.django_db
+    def test_shift_cycle(self, django_assert_num_queries, equipment, shift):
+        """Verify that shift_cycle holds each shift's duration, weighting and position."""
+        equipment.shifts.add(shift)
+        with django_assert_num_queries(1):
+            durations, weightings, positions = equipment.shift_cycle
+            assert equipment.shift_cycle[2] is positions
+        assert durations == (shift.duration,)
+        assert weightings == (shift.weighting,)
+        assert positions == {shift.pk: 0}
+
+
+class TestCalTable:
+    """Tests for the calendar table built from an equipment's bookings."""
+
+    def test_calendar_start_day_read_once_per_request(self, rf):
+        """Verify that the calendar start day setting is remembered for the rest of the request."""
+        # external imports
+        from equipment.tables import calendar_date_vector, calendar_start_day
+
+        request = rf.get("/")
+        with patch("equipment.tables.config") as config:
+            config.CALENDAR_START_DAY = "2"
+            assert calendar_start_day(request) == 2
+            config.CALENDAR_START_DAY = "3"
+            assert calendar_start_day(request) == 2
+            assert calendar_start_day(rf.get("/")) == 3
+        assert calendar_date_vector(datetime(2024, 1, 4), start_day=2)[0].weekday() == 2
+
+    @pytest.mark.parametrize(
+        "target,mode,expected",
+        [
+            (datetime(2024, 1, 1, 12), "start", (1, 1)),
+            (datetime(2024, 1, 1, 12), "end", (1, 1)),
+            (datetime(2024, 1, 1, 14), "nearest", (2, 1)),
+            (datetime(2024, 1, 2, 18), "start", (2, 2)),
+            (datetime(2024, 1, 2, 18), "end", (2, 2)),
+            (datetime(2023, 12, 31), "start", (1, 1)),
+            (datetime(2023, 12, 31), "end", (2, 0)),
+        ],
+    )
+    def test_datetime_to_coord(self, target, mode, expected):
+        """Verify that datetimes are placed in the calendar cell that the mode asks for."""
+        # external imports
+        from equipment.tables import calendar_grid, datetime_to_coord
+
+        date_vec = [datetime(2024, 1, 1).date(), datetime(2024, 1, 2).date()]
+        time_vec = [time(9), time(17)]
+        assert datetime_to_coord(target, date_vec, time_vec, mode) == expected
+        grid = calendar_grid(date_vec, time_vec)
+        assert datetime_to_coord(target, date_vec, time_vec, mode, grid=grid) == expected
+
+    @pytest.mark.django_db
+    def test_fill_entries_queries_do_not_grow_with_bookings(
+        self, django_assert_num_queries, equipment, regular_user, role_trainee, shift
+    ):
+        """Verify that filling the calendar reads the bookings and the userlist once each."""
+        # external imports
+        from bookings.models import BookingEntry
+        from equipment.models import UserListEntry
+        from equipment.tables import CalTable
+        from labman_utils.models import DEFAULT_TZ
+
+        equipment.shifts.add(shift)
+        UserListEntry.objects.create(equipment=equipment, user=regular_user, role=role_trainee)
+        with patch.object(BookingEntry, "clean"), patch.object(BookingEntry, "calculate_charge", return_value=0.0):
+            for day in (1, 2, 3):
+                BookingEntry.objects.create(
+                    user=regular_user,
+                    booker=regular_user,
+                    equipment=equipment,
+                    slot=(datetime(2024, 1, day, 9, tzinfo=DEFAULT_TZ), datetime(2024, 1, day, 12, tzinfo=DEFAULT_TZ)),
+                    charge=0.0,
+                )
+        table = CalTable(date=20240102, equipment=equipment, table_contents="&nbsp;")
+        with django_assert_num_queries(2):
+            entries = table.fill_entries(equipment)
+            assert {entry.calendar_css for entry in entries} == {role_trainee.css}
+        assert len(entries) == 3
+
+    @pytest.mark.django_db
+    def test_fill_entries_spans_days(self, equipment, regular_user, shift):
+        """Verify that a booking over several days fills each day's cell, looking its css up only once."""
+        # external imports
+        from bookings.models import BookingEntry
+        from equipment.tables import CalTable
+        from labman_utils.models import DEFAULT_TZ
+
+        equipment.shifts.add(shift)
+        with patch.object(BookingEntry, "clean"), patch.object(BookingEntry, "calculate_charge", return_value=0.0):
+            BookingEntry.objects.create(
+                user=regular_user,
+                booker=regular_user,
+                equipment=equipment,
+                slot=(datetime(2024, 1, 2, 9, tzinfo=DEFAULT_TZ), datetime(2024, 1, 4, 12, tzinfo=DEFAULT_TZ)),
+                charge=0.0,
+            )
+        table = CalTable(date=20240102, equipment=equipment, table_contents="&nbsp;")
+        with patch.object(BookingEntry, "calendar_css", new_callable=PropertyMock, return_value="booked") as css:
+            table.fill_entries(equipment)
+        assert css.call_count == 1
+        filled = [col for col in range(1, 8) if table[1, col].content == regular_user.display_name]
+        assert len(filled) == 3
+        assert all("booked" in table[1, col].classes for col in filled)
+
+
 class TestEquipmentViews:
     """Integration tests for equipment app views."""
 
@@ -8,13 +8,11 @@ booking and comprehensive equipment detail views with tabbed interfaces.
 # Python imports
 import json
 from datetime import datetime as dt, timedelta as td
-from itertools import chain
 
 # Django imports
 from django import views
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Count
 from django.http import (
     HttpResponse,
     HttpResponseForbidden,
@@ -47,7 +45,7 @@ from .forms import (
     UserListEnryForm,
 )
 from .models import DocumentSignOff, Equipment, Location, UserListEntry
-from .tables import CalTable
+from .tables import CalTable, category_calendar
 
 DEFAULT_TZ = pytz.timezone(settings.TIME_ZONE)
 
@@ -265,28 +263,14 @@ class EquipmentDetailView(HTMXProcessMixin, IsAuthenticaedViewMixin, views.gener
                 context["end"] = table.date_vec[-1]
                 context["start_date"] = table.date_vec[0].strftime("%Y%m%d")
             case "all":
-                equipment = None
                 table = {}
                 entries = {}
                 for cat in Equipment.CATEGORIES:
-                    equip_vec = (
-                        Equipment.objects.filter(category=cat)
-                        .annotate(policy_count=Count("policies"))
-                        .filter(policy_count__gt=0, offline=False)
-                        .prefetch_related("shifts")
-                        .order_by("name")
-                    )
-                    if equip_vec.count() == 0:
+                    cat_table, cat_entries = category_calendar(cat, self.kwargs.get("date", date), self.request)
+                    if cat_table is None:
                         continue
-                    table[cat] = CalTable(
-                        date=self.kwargs.get("date", date),
-                        request=self.request,
-                        equipment=equipment,
-                        equip_vec=equip_vec,
-                        table_contents="&nbsp;",
-                    )
-                    table[cat].classes += " table-bordered"
-                    entries[cat] = chain(*(table[cat].fill_entries(equipment) for equipment in equip_vec))
+                    table[cat] = cat_table
+                    entries[cat] = cat_entries
                 context["start"] = table["cryostat"].date_vec[0]
                 context["end"] = table["cryostat"].date_vec[-1]
                 context["start_date"] = table["cryostat"].date_vec[0].strftime("%Y%m%d")
@@ -8,6 +8,7 @@ helper functions for working with dates and times.
 """
 # Python imports
 from datetime import date, datetime as dt, time, timedelta as td
+from zoneinfo import ZoneInfo
 
 # Django imports
 from django.apps import apps
@@ -18,7 +19,6 @@ from django.db import models, transaction
 from django.utils.html import format_html
 
 # external imports
-import pytz
 from django_simple_file_handler import models as dsfh
 from photologue.models import Photo
 from sitetree.models import TreeBase, TreeItemBase
@@ -29,7 +29,7 @@ from tinymce.models import HTMLField
 from .fields import ObfuscatedCharField
 from .widgets import AdminObfuscatedTinyMCE, ObfuscatedTinyMCE
 
-DEFAULT_TZ = pytz.timezone(settings.TIME_ZONE)
+DEFAULT_TZ = ZoneInfo(settings.TIME_ZONE)
 
 
 def getattribute(obj, attr):
@@ -118,10 +118,6 @@ def to_seconds(value):
     Returns:
         (int): Number of seconds since midnight.
 
-    Notes:
-        This function appears to have a bug - it uses 50 for minute conversion
-        instead of 60. This may be intentional but should be verified.
-
 
     Examples:
         Inspect the public interface in an interactive session::
@@ -178,7 +174,7 @@ def replace_time(date_time, seconds):
         (datetime): A datetime with the same date but time set to the specified seconds.
 
     Notes:
-        The returned datetime will have a timezone applied via ensure_tz.
+        The returned datetime is a wall-clock time in DEFAULT_TZ.
 
 
     Examples:
@@ -188,10 +184,7 @@ def replace_time(date_time, seconds):
             True
 
     """
-    day = date_time.date()
-    delta_time = td(seconds=seconds)
-    ret = dt.combine(day, time.min) + delta_time
-    return ensure_tz(ret)
+    return dt.combine(date_time.date(), time.min, tzinfo=DEFAULT_TZ) + td(seconds=seconds)
 
 
 def ensure_tz(time):
@@ -217,7 +210,7 @@ def ensure_tz(time):
 
     """
     if time.tzinfo is None:
-        time = DEFAULT_TZ.localize(time)
+        time = time.replace(tzinfo=DEFAULT_TZ)
     return time
 
 
@@ -195,6 +195,19 @@ class TestDeltaT:
         assert result == timedelta(hours=2)
 
 
+class TestReplaceTime:
+    """Tests for the replace_time utility function."""
+
+    def test_sets_wall_clock_time_in_default_tz(self):
+        """replace_time keeps the date and sets a local wall-clock time with the correct DST offset."""
+        # external imports
+        from labman_utils.models import DEFAULT_TZ, replace_time
+
+        result = replace_time(datetime(2024, 6, 15, 3, 30), 9 * 3600)
+        assert result == datetime(2024, 6, 15, 9, 0, tzinfo=DEFAULT_TZ)
+        assert result.tzinfo is DEFAULT_TZ
+
+
 class TestEnsureTz:
     """Tests for the ensure_tz utility function."""
 
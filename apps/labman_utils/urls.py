@@ -21,7 +21,7 @@ class FloatUrlParameterConverter:
 
     """
 
-    regex = r"[0-9]+\.?[0-9]+"
+    regex = r"[0-9]+(?:\.[0-9]+)?"
 
     def to_python(self, value):
         """Perform the to python operation.